@@ -188,6 +188,10 @@ class JSauceApp:
                 processed_domains.add(domain)
                 self.logger.debug(f"Cleared domain files for {domain}")
             
+            # Fetch the next page while this URL's JS files are analyzed
+            if i < len(urls):
+                self.url_processor.prefetch_page(urls[i])
+            
             # Process the URL and check if we got results
             success = self.url_processor.process_url(url, templates)
             
@@ -218,8 +222,11 @@ class JSauceApp:
     def _cleanup(self):
         """Clean up resources"""
         self.banner.add_status("Cleaning up resources...")
+        if hasattr(self, 'url_processor'):
+            self.url_processor.close()
         self.web_requests.close_session()
         self.logger.debug("Session closed", "success")
+        self.banner.flush()
 
 def main():
     """Entry point - create and run the application"""
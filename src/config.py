@@ -22,9 +22,41 @@ DATA_DIR = "./data"
 JS_FILE_DIR = f"{DATA_DIR}/js_files"
 URL_CONTENT_DIR = f"{DATA_DIR}/url_content"
 
+# Keep a gzipped copy of each fetched page in URL_CONTENT_DIR (only needed for later reference)
+SAVE_HTML_CONTENT = False
+
+# Buffer size for large output file writes (bytes)
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Timeout for web requests (seconds)
 REQUEST_TIMEOUT = 10
 
+# Domains rendered to SVG/PNG at once - each runs 2 mmdc (headless Chromium) processes
+MERMAID_RENDER_WORKERS = 2
+
+# Minimum gap between per-file progress messages (seconds)
+PROGRESS_INTERVAL = 0.1
+
+# Number of JS files fetched concurrently per URL
+JS_FETCH_WORKERS = 16
+
+# HTTP connection pool size per host (keep above JS_FETCH_WORKERS) and retries for 502/503/504 responses
+HTTP_POOL_SIZE = 64
+HTTP_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.3
+
+# Largest JS file fetched and scanned (bytes) - bigger bundles are skipped
+MAX_JS_BYTES = 20 * 1024 * 1024
+
+# Number of fetched JS files kept in memory for reuse across URLs (0 disables the cache)
+FETCH_CACHE_MAX = 256
+
+# Total size of fetched JS kept in that cache (bytes, counted as decoded length) - larger files are never cached
+FETCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Number of JS scan results kept by content digest (0 disables reuse)
+SCAN_CACHE_MAX = 1024
+
 # User agents for web requests
 USER_AGENTS = [
     # Chrome Windows
@@ -1,23 +1,69 @@
+import functools
 from urllib.parse import urlparse   
+from src import config
+
+
+# memoized so the same URL seen across processing phases is only parsed once
+@functools.lru_cache(maxsize=4096)
+def _extract_domain_cached(url):
+    """Extract just the domain name from a URL"""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc
+        
+        # Remove 'www.' prefix if present
+        if domain.startswith('www.'):
+            domain = domain[4:]
+            
+        return domain
+    except:
+        return None
+
+
+class DomainPaths:
+    """Output file locations for one domain/template, built once and reused by every save"""
+    __slots__ = ('domain', 'directory', 'found', 'detailed', 'for_db', 'stats',
+                 'detailed_file', 'mmd', 'svg', 'png')
+
+    def __init__(self, domain, template):
+        prefix = f"{domain}/{domain}_{template}"
+        self.domain = domain
+        self.directory = f"{config.OUTPUT_DIR}/{domain}"
+
+        # relative to OUTPUT_DIR - the form CategoryProcessor's save methods expect
+        self.found = f"{prefix}_found.txt"
+        self.detailed = f"{prefix}_detailed.json"
+        self.for_db = f"{prefix}_for_db.json"
+        self.stats = f"{prefix}_stats.json"
+
+        # full paths used by the Mermaid converter
+        self.detailed_file = f"{config.OUTPUT_DIR}/{self.detailed}"
+        flowchart = f"{config.OUTPUT_DIR}/{prefix}_flowchart"
+        self.mmd = f"{flowchart}.mmd"
+        self.svg = f"{flowchart}.svg"
+        self.png = f"{flowchart}.png"
+
 
 class DomainHandler:
     def __init__(self):
-        pass
+        self._domain_paths = {}
 
     def extract_domain(self, url):
         """Extract just the domain name from a URL"""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            
-            # Remove 'www.' prefix if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
-                
-            return domain
-        except:
+            return _extract_domain_cached(url)
+        except TypeError:
+            # unhashable input, nothing sensible to cache
             return None
 
+    def get_domain_paths(self, domain, template):
+        """Get the cached output paths for a domain"""
+        key = (domain, template)
+        paths = self._domain_paths.get(key)
+        if paths is None:
+            paths = self._domain_paths[key] = DomainPaths(domain, template)
+        return paths
+
     def get_unique_domains(self, urls):
         """Get unique domain names from a list of URLs"""
         domains = set()
@@ -25,4 +71,4 @@ class DomainHandler:
             domain = self.extract_domain(url)
             if domain:
                 domains.add(domain)
-        return sorted(list(domains))
\ No newline at end of file
+        return sorted(list(domains))
@@ -1,5 +1,7 @@
 from src import config
+import json
 import os
+import shutil
 import time
 from src.utils.Logger import get_logger
 
@@ -23,8 +25,15 @@ class OutFileHandler:
         domain_path = f"{config.OUTPUT_DIR}/{domain}"
         self.logger.debug(f"Domain path: {domain_path}")
         
+        # One listing of the directory (if it exists from previous runs) instead of probing each file
+        try:
+            with os.scandir(domain_path) as entries:
+                existing_files = {entry.name: entry for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            existing_files = None
+        
         # Only clear if directory already exists (from previous runs)
-        if os.path.exists(domain_path):
+        if existing_files is not None:
             self.logger.verbose(f"Found existing domain directory: {domain_path}")
             
             file_suffixes = [
@@ -40,18 +49,19 @@ class OutFileHandler:
             files_failed = 0
             
             for suffix in file_suffixes:
-                file_path = f"{domain_path}/{domain}_{suffix}"
+                filename = f"{domain}_{suffix}"
+                file_path = f"{domain_path}/{filename}"
                 
                 try:
-                    if os.path.exists(file_path):
-                        file_size = os.path.getsize(file_path)
+                    entry = existing_files.get(filename)
+                    if entry is not None:
+                        file_size = entry.stat().st_size
                         self.logger.debug(f"Processing file: {file_path} ({file_size} bytes)")
                         
                         # Create backup before clearing (safety net)
                         backup_path = f"{file_path}.pre_run_backup"
                         
                         if file_size > 0:  # Only backup non-empty files
-                            import shutil
                             shutil.copy2(file_path, backup_path)
                             files_backed_up += 1
                             self.logger.debug(f"Created backup: {backup_path}")
@@ -94,9 +104,10 @@ class OutFileHandler:
         directories = [
             config.DATA_DIR,
             config.JS_FILE_DIR,
-            config.URL_CONTENT_DIR,
             config.OUTPUT_DIR
         ]
+        if config.SAVE_HTML_CONTENT:
+            directories.append(config.URL_CONTENT_DIR)
         
         created_dirs = 0
         existing_dirs = 0
@@ -140,7 +151,6 @@ class OutFileHandler:
             
             # Try to append the JSON object
             with open(file_path, 'a', encoding='utf-8') as f:
-                import json
                 json.dump(json_data, f, ensure_ascii=False)
                 f.write('\n')  # Add newline for easier parsing later
             
@@ -157,7 +167,6 @@ class OutFileHandler:
                 self.logger.debug("Attempting recovery by creating new file")
                 
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    import json
                     json.dump([json_data], f, indent=2, ensure_ascii=False)
                 
                 recovery_size = os.path.getsize(file_path)
@@ -290,20 +299,23 @@ class OutFileHandler:
         }
         
         try:
-            for filename in os.listdir(domain_path):
-                file_path = os.path.join(domain_path, filename)
+            # scandir hands back each entry's type, one stat() then covers size and mtime
+            with os.scandir(domain_path) as entries:
+                file_entries = [entry for entry in entries if entry.is_file()]
+            
+            for entry in file_entries:
+                filename = entry.name
+                file_stat = entry.stat()
+                file_size = file_stat.st_size
+                file_mtime = file_stat.st_mtime
                 
-                if os.path.isfile(file_path):
-                    file_size = os.path.getsize(file_path)
-                    file_mtime = os.path.getmtime(file_path)
-                    
-                    stats['files'][filename] = {
-                        'size': file_size,
-                        'modified': file_mtime
-                    }
-                    
-                    stats['total_files'] += 1
-                    stats['total_size'] += file_size
+                stats['files'][filename] = {
+                    'size': file_size,
+                    'modified': file_mtime
+                }
+                
+                stats['total_files'] += 1
+                stats['total_size'] += file_size
             
             self.logger.debug(f"Domain {domain} statistics: {stats['total_files']} files, {stats['total_size']} bytes")
             return stats
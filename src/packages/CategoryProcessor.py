@@ -16,7 +16,15 @@ class CategoryProcessor:
         self.banner = banner
         self.domain_handler = domain_handler
         self.logger = get_logger()
+        self._created_dirs = set()  # output dirs already made this run
       
+    def _ensure_parent_dir(self, file_path):
+        """Create a file's directory once per run - every save for a domain shares it"""
+        directory = os.path.dirname(file_path)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
     def _is_false_positive(self, match, category):
         """Check if match is a false positive"""
         if not match or len(match) > 200:
@@ -117,7 +125,7 @@ class CategoryProcessor:
         self.logger.debug(f"Saving {len(endpoints)} endpoints to {file_path}")
 
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self._ensure_parent_dir(file_path)
             with open(file_path, 'a+') as f:
                 for endpoint in endpoints:
                     f.write(endpoint + '\n')
@@ -132,7 +140,7 @@ class CategoryProcessor:
 
         try:
             file_path = f"{config.OUTPUT_DIR}/{output_file}"
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self._ensure_parent_dir(file_path)
             
             # Build the data structure
             results_by_source = {}
@@ -188,7 +196,7 @@ class CategoryProcessor:
 
         try:
             file_path = f"{config.OUTPUT_DIR}/{output_file}"
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self._ensure_parent_dir(file_path)
             
             flat_endpoints = []
             content_id = 1
@@ -234,7 +242,7 @@ class CategoryProcessor:
 
         try:
             file_path = f"{config.OUTPUT_DIR}/{output_file}"
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self._ensure_parent_dir(file_path)
             
             stats = {
                 'sources': {}, 
@@ -303,7 +311,7 @@ class CategoryProcessor:
         
         # Method 1: Try simple append
         try:
-            with open(file_path, 'a', encoding='utf-8') as f:
+            with open(file_path, 'a', encoding='utf-8', buffering=config.WRITE_BUFFER_SIZE) as f:
                 json.dump(json_data, f, ensure_ascii=False)
             self.logger.debug(f"Simple append succeeded for {file_path}")
             return json_data
@@ -349,7 +357,7 @@ class CategoryProcessor:
                 existing_data.append(json_data)
                 
                 # Write back everything
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with open(file_path, 'w', encoding='utf-8', buffering=config.WRITE_BUFFER_SIZE) as f:
                     json.dump(existing_data, f, indent=2, ensure_ascii=False)
                     
                 self.logger.debug(f"Appended new data to {file_path}")
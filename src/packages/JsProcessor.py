@@ -1,14 +1,31 @@
 import os
 import re
-from urllib.parse import urljoin
+import hashlib
+from collections import OrderedDict
+from urllib.parse import urljoin, urldefrag, urlsplit, urlunsplit
 from src.utils.Logger import get_logger
 from src import config
 
+
+def _normalize_js_link(link):
+    """Drop the #fragment and lowercase scheme/host so the same file is only fetched once"""
+    try:
+        parts = urlsplit(urldefrag(link)[0])
+    except ValueError:
+        return link
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+
 class JsProcessor:
     def __init__(self, banner, category_processor):
         self.banner = banner
         self.category_processor = category_processor
         self.logger = get_logger()
+        self._js_dir_ready = False  # JS_FILE_DIR created yet this run
+
+        # Findings by content digest - the same CDN file on many sites is only scanned once
+        self._scan_cache = OrderedDict()
+        self._scan_templates = None  # templates the cached findings were produced with
 
 
     # parse saved url content for js links
@@ -47,7 +64,7 @@ class JsProcessor:
                 self.logger.warning(f"Skipping malformed URL: {link}")
                 continue
                 
-            js_links.append(clean_link)
+            js_links.append(_normalize_js_link(clean_link))
         
         # Remove duplicates while preserving order
         seen = set()
@@ -66,7 +83,9 @@ class JsProcessor:
     # save js links to file
     def save_js_links(self, js_links, output_file):
         # look it through until we reach the end
-        os.makedirs(f"{config.JS_FILE_DIR}", exist_ok=True)
+        if not self._js_dir_ready:
+            os.makedirs(f"{config.JS_FILE_DIR}", exist_ok=True)
+            self._js_dir_ready = True
         file_path = f"{config.JS_FILE_DIR}/{output_file}"
 
         try:
@@ -111,10 +130,45 @@ class JsProcessor:
         self.logger.debug(f"KS content length: {len(js_content)} bytes")
 
         templates = templates_by_category or self.category_processor.templates_by_category
-        results = {}
         total_patterns = sum(len(patterns) for patterns in templates.values())
         patterns_processed = 0
+
+        if templates is not self._scan_templates:
+            self._scan_cache.clear()
+            self._scan_templates = templates
+        digest = hashlib.blake2b(js_content.encode('utf-8', 'replace'), digest_size=16).digest()
+        results = self._scan_cache.get(digest)
+        if results is not None:
+            self._scan_cache.move_to_end(digest)
+            self.logger.debug(f"Reusing findings for identical content at {js_url}")
+        else:
+            results = self._scan_categories(js_content, templates)
+            if config.SCAN_CACHE_MAX > 0:
+                self._scan_cache[digest] = results
+                if len(self._scan_cache) > config.SCAN_CACHE_MAX:
+                    self._scan_cache.popitem(last=False)
+
+        total_matches = sum(len(matches) for matches in results.values())
+        self.logger.log_js_analysis(js_url, total_matches, total_patterns)
+        
+        # Store results
+        if js_url not in self.category_processor.detailed_results:
+           self.category_processor.detailed_results[js_url] = {'source_url': source_url, 'js_url': js_url, 'categories': {}}
+        
+        for category, matches in results.items():
+            if category not in self.category_processor.detailed_results[js_url]['categories']:
+                self.category_processor.detailed_results[js_url]['categories'][category] = []
+            self.category_processor.detailed_results[js_url]['categories'][category].extend(matches)
+            self.category_processor.detailed_results[js_url]['categories'][category] = list(dict.fromkeys(
+                self.category_processor.detailed_results[js_url]['categories'][category]
+            ))
         
+        return results
+
+    def _scan_categories(self, js_content, templates):
+        """Run every template pattern over the JS content"""
+        results = {}
+
         for category, patterns in templates.items():
             matches = []
             for pattern in patterns:
@@ -142,21 +196,6 @@ class JsProcessor:
                     results[category] = list(dict.fromkeys(filtered))
                     self.logger.verbose(f"Found {len(filtered)} matches in {category}")
 
-        total_matches = sum(len(matches) for matches in results.values())
-        self.logger.log_js_analysis(js_url, total_matches, total_patterns)
-        
-        # Store results
-        if js_url not in self.category_processor.detailed_results:
-           self.category_processor.detailed_results[js_url] = {'source_url': source_url, 'js_url': js_url, 'categories': {}}
-        
-        for category, matches in results.items():
-            if category not in self.category_processor.detailed_results[js_url]['categories']:
-                self.category_processor.detailed_results[js_url]['categories'][category] = []
-            self.category_processor.detailed_results[js_url]['categories'][category].extend(matches)
-            self.category_processor.detailed_results[js_url]['categories'][category] = list(dict.fromkeys(
-                self.category_processor.detailed_results[js_url]['categories'][category]
-            ))
-        
         return results
         
     def search_js_content_by_category(self, js_content, templates_by_category=None):
@@ -5,11 +5,14 @@ class MermaidCLI:
     def __init__(self, banner):
         self.banner = banner
     
+    def _command(self, input_file, output_file):
+        return ['mmdc', '-i', input_file, '-o', output_file, '-t', 'dark']
+    
     def render(self, input_file, output_file):
         try:
             # On Windows, use shell=True to access PATH properly
             subprocess.run(
-                ['mmdc', '-i', input_file, '-o', output_file, '-t', 'dark'],
+                self._command(input_file, output_file),
                 check=True,
                 shell=True if platform.system() == 'Windows' else False
             )
@@ -18,9 +21,33 @@ class MermaidCLI:
             self.banner.show_error(f"Error rendering Mermaid file: {e}")
             return False
 
+    def render_many(self, input_file, output_files):
+        """Render one .mmd to several outputs at once - returns {output_file: success}"""
+        # mmdc writes a single format per run, so start every run up front and wait once
+        # instead of paying for each browser start-up back to back
+        processes = {}
+        results = {}
+        for output_file in output_files:
+            try:
+                processes[output_file] = subprocess.Popen(
+                    self._command(input_file, output_file),
+                    shell=True if platform.system() == 'Windows' else False
+                )
+            except OSError as e:
+                self.banner.show_error(f"Error rendering Mermaid file: {e}")
+                results[output_file] = False
+        
+        for output_file, process in processes.items():
+            returncode = process.wait()
+            if returncode != 0:
+                error = subprocess.CalledProcessError(returncode, process.args)
+                self.banner.show_error(f"Error rendering Mermaid file: {error}")
+            results[output_file] = returncode == 0
+        return {output_file: results[output_file] for output_file in output_files}
+
     def is_available(self):
         try:
             subprocess.run(['mmdc', '--version'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True if platform.system() == 'Windows' else False)
             return True
         except:
-            return False
\ No newline at end of file
+            return False
@@ -1,17 +1,86 @@
+import functools
+import io
 import json
 import re
 from typing import List, Dict, Any
 from urllib.parse import urlparse
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 from src import config
-import time
 import shutil
+import heapq
 from src.utils.Logger import get_logger
 
+try:
+    import orjson  # optional - faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # optional - lazy parsing, only used keys get materialized
+except ImportError:
+    simdjson = None
+
+# Precompiled patterns for id sanitizing
+_NON_WORD_RE = re.compile(r'[^\w]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+_CLEAN_ID_RE = re.compile(r'[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*')
+
+# Strip brackets and swap double quotes so endpoint labels stay valid Mermaid
+_ENDPOINT_LABEL_TABLE = str.maketrans({'[': '', ']': '', '"': "'"})
+
+
+@functools.lru_cache(maxsize=1024)
+def _category_display(category):
+    """Human readable category label, e.g. 'api_endpoints' -> 'Api Endpoints'"""
+    return category.replace('_', ' ').title()
+
+
+class _LineStream:
+    """List-like line sink that writes newline-joined lines straight to a text stream"""
+    __slots__ = ('_write', '_count')
+
+    def __init__(self, out):
+        self._write = out.write
+        self._count = 0
+
+    def append(self, line):
+        self._write('\n' + line if self._count else line)
+        self._count += 1
+
+    def __len__(self):
+        return self._count
+
+def _json_loads(data):
+    """Parse JSON text/bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _write_json_file(file_path, data):
+    """Write data as 2-space indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:  # e.g. integers wider than 64 bits - let stdlib handle it
+            payload = None
+        if payload is not None:
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+            return
+    
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 class JSONToMermaidConverter:
+    # Line templates for the fixed node/edge shapes
+    _NODE_TMPL = '    %s["%s"]'
+    _EDGE_TMPL = '    %s --> %s'
+    _EMPTY_FLOWCHART = 'flowchart LR\n    START([No data])\n'
+
     def __init__(self, domain_handler, banner, mermaid_cli, template, max_edges=450, max_text_size=50000):
-        self.used_ids = set()
+        self._id_counter = {}  # handed-out id -> last suffix issued for it
         self.max_edges = max_edges
         self.max_text_size = max_text_size
         self.edge_count = 0
@@ -21,6 +90,9 @@ class JSONToMermaidConverter:
         self.mermaid_cli = mermaid_cli
         self.template = template
         self.logger = get_logger()
+        # Checked before building debug messages in per-node loops
+        self._debug_on = self.logger.is_debug_enabled()
+        self._simdjson_parser = simdjson.Parser() if simdjson is not None else None
         
         self.logger.debug(f"Initializing JSONToMermaidConverter with template: {template}")
         self.logger.debug(f"Limits: max_edges={max_edges}, max_text_size={max_text_size}")
@@ -43,30 +115,20 @@ class JSONToMermaidConverter:
             'social_features', 'content_management'
         }
         
+        # Category -> priority lookup (anything not listed defaults to 3)
+        self._priority_map = {category: 1 for category in self.high_priority_categories}
+        self._priority_map.update({category: 2 for category in self.medium_priority_categories})
+        
         self.logger.verbose(f"Priority categories defined: {len(self.high_priority_categories)} high, {len(self.medium_priority_categories)} medium, {len(self.low_priority_categories)} low")
    
-    def sanitize_text(self, text: str) -> str:
-        """Sanitize text for Mermaid compatibility"""
-        original_text = text
-        text = re.sub(r'[^\w\s-]', '_', text)
-        text = re.sub(r'\s+', '_', text)
-        
-        if original_text != text:
-            self.logger.debug(f"Sanitized text: '{original_text}' -> '{text}'")
-        
-        return text
-    
     # clean json files after append
     def clean_json_files(self, urls):
         """Clean up malformed JSON files - improved version"""
         self.logger.info("Starting JSON file cleanup process")
         self.banner.add_status("CLEANING UP JSON FILES...")
         
-        processed_files = 0
-        fixed_files = 0
-        skipped_files = 0
-        error_files = 0
-        
+        # Collect candidate files first (keyed by path so no file is handled by two workers)
+        json_files = {}
         for url in urls:
             domain = self.domain_handler.extract_domain(url)
             if not domain:
@@ -79,107 +141,27 @@ class JSONToMermaidConverter:
             json_suffixes = [f'{self.template}_detailed', f'{self.template}_content_for_db', f'{self.template}_content_stats']
             
             for suffix in json_suffixes:
-                json_file = f"{config.OUTPUT_DIR}/{domain}/{domain}_{suffix}.json"
-                processed_files += 1
-                
-                if not os.path.exists(json_file):
-                    self.logger.debug(f"Skipping non-existent file: {json_file}")
-                    self.banner.add_status(f"Skipping {json_file} - file doesn't exist")
-                    skipped_files += 1
-                    continue
-                    
-                file_size = os.path.getsize(json_file)
-                if file_size == 0:
-                    self.logger.debug(f"Skipping empty file: {json_file}")
-                    self.banner.add_status(f"Skipping {json_file} - file is empty")
-                    skipped_files += 1
-                    continue
-                
-                self.logger.verbose(f"Processing JSON file: {json_file} ({file_size} bytes)")
-                
-                try:
-                    # Create backup before processing
-                    backup_file = f"{json_file}.backup"
-                    shutil.copy2(json_file, backup_file)
-                    self.logger.debug(f"Created backup: {backup_file}")
-                    
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                    
-                    if not content:
-                        self.logger.debug(f"File has no content after strip: {json_file}")
-                        self.banner.add_status(f"Skipping {json_file} - no content after strip")
-                        if backup_file and os.path.exists(backup_file):
-                            os.remove(backup_file)
-                        skipped_files += 1
-                        continue
-                        
-                    # Check if it's already valid JSON
-                    try:
-                        parsed_data = json.loads(content)
-                        self.logger.debug(f"File already contains valid JSON: {json_file}")
-                        self.banner.add_status(f"{json_file} already valid JSON")
-
-                        # Rewrite with proper formatting
-                        with open(json_file, 'w', encoding='utf-8') as f:
-                            json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-                        
-                        if backup_file and os.path.exists(backup_file):
-                            os.remove(backup_file)
-                        
-                        self.logger.debug(f"Reformatted valid JSON file: {json_file}")
-                        continue
-
-                    except json.JSONDecodeError as e:
-                        self.logger.warning(f"JSON decode error in {json_file}: {e}")
-                        self.logger.debug(f"Attempting to fix malformed JSON")
-                    
-                    # Fix the JSON structure
-                    fixed_content = self._fix_malformed_json(content, json_file)
-                    
-                    if fixed_content:
-                        # Validate the fixed content before writing
-                        try:
-                            parsed_data = json.loads(fixed_content)
-                            
-                            # Write the fixed content
-                            with open(json_file, 'w', encoding='utf-8') as f:
-                                json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-                            
-                            fixed_files += 1
-                            self.logger.success(f"Successfully fixed malformed JSON: {json_file}")
-                            self.banner.add_status(f"Fixed {json_file}")        
-                            
-                            if backup_file and os.path.exists(backup_file):
-                                os.remove(backup_file)
-                            
-                        except json.JSONDecodeError as e:
-                            error_files += 1
-                            self.logger.error(f"Failed to validate fixed JSON for {json_file}: {e}")
-                            self.banner.show_error(f"Failed to validate fixed JSON for {json_file}: {e}")
-                            # Restore from backup
-                            shutil.move(backup_file, json_file)
-                            
-                    else:
-                        error_files += 1
-                        self.logger.error(f"Could not fix malformed JSON: {json_file}")
-                        self.banner.show_error(f"Could not fix malformed JSON: {json_file}")
-                        # Keep backup, mark original as problematic
-                        os.rename(json_file, f"{json_file}.corrupted")
-                        shutil.move(backup_file, json_file)
-                        
-                except Exception as e:
-                    error_files += 1
-                    self.logger.error(f"Error processing {json_file}: {e}")
-                    self.banner.show_error(f"Error processing {json_file}: {e}")
-                    # Restore backup if it exists
-                    backup_file = f"{json_file}.backup"
-                    if os.path.exists(backup_file):
-                        try:
-                            shutil.move(backup_file, json_file)
-                            self.logger.debug(f"Restored backup for {json_file}")
-                        except Exception as restore_error:
-                            self.logger.error(f"Failed to restore backup: {restore_error}")
+                json_files[f"{config.OUTPUT_DIR}/{domain}/{domain}_{suffix}.json"] = domain
+        
+        # Each file is independent - overlap the read/parse/write work across files
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._clean_one, json_files))
+        
+        # One summary per domain instead of a status line per file
+        domain_results = defaultdict(list)
+        for domain, result in zip(json_files.values(), results):
+            domain_results[domain].append(result)
+        
+        for domain, statuses in domain_results.items():
+            fixed, skipped, errors = statuses.count('fixed'), statuses.count('skipped'), statuses.count('error')
+            self.logger.info(f"JSON cleanup for {domain}: fixed={fixed} skipped={skipped} errors={errors}")
+            self.banner.add_status(f"Cleaned JSON for {domain}: {fixed} fixed, {skipped} skipped, {errors} errors")
+        
+        processed_files = len(results)
+        fixed_files = results.count('fixed')
+        skipped_files = results.count('skipped')
+        error_files = results.count('error')
         
         # Log cleanup summary
         self.logger.info(f"JSON cleanup completed:")
@@ -188,8 +170,94 @@ class JSONToMermaidConverter:
         self.logger.info(f"  - Skipped: {skipped_files} files")
         self.logger.info(f"  - Errors: {error_files} files")
 
+    def _clean_one(self, json_file):
+        """Clean a single JSON file - returns 'valid', 'fixed', 'skipped' or 'error'"""
+        # One stat call covers both the existence and the size check
+        try:
+            file_size = os.stat(json_file).st_size
+        except FileNotFoundError:
+            self.logger.debug(f"Skipping non-existent file: {json_file}")
+            return 'skipped'
+            
+        if file_size == 0:
+            self.logger.debug(f"Skipping empty file: {json_file}")
+            return 'skipped'
+        
+        self.logger.verbose(f"Processing JSON file: {json_file} ({file_size} bytes)")
+        
+        try:
+            # Create backup before processing
+            backup_file = f"{json_file}.backup"
+            shutil.copy2(json_file, backup_file)
+            self.logger.debug(f"Created backup: {backup_file}")
+            
+            with open(json_file, 'r', encoding='utf-8') as f:
+                content = f.read().strip()
+            
+            if not content:
+                self.logger.debug(f"File has no content after strip: {json_file}")
+                self._remove_backup(backup_file)
+                return 'skipped'
+                
+            # Check if it's already valid JSON
+            try:
+                parsed_data = _json_loads(content)
+                self.logger.debug(f"File already contains valid JSON: {json_file}")
+
+                # Rewrite with proper formatting
+                _write_json_file(json_file, parsed_data)
+                
+                self._remove_backup(backup_file)
+                
+                self.logger.debug(f"Reformatted valid JSON file: {json_file}")
+                return 'valid'
+
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"JSON decode error in {json_file}: {e}")
+                self.logger.debug(f"Attempting to fix malformed JSON")
+            
+            # Fix the JSON structure (returns the already parsed data)
+            parsed_data = self._fix_malformed_json(content, json_file)
+            
+            if parsed_data is not None:
+                # Write the fixed content
+                _write_json_file(json_file, parsed_data)
+                
+                self.logger.success(f"Successfully fixed malformed JSON: {json_file}")
+                
+                self._remove_backup(backup_file)
+                return 'fixed'
+                    
+            else:
+                self.logger.error(f"Could not fix malformed JSON: {json_file}")
+                self.banner.show_error(f"Could not fix malformed JSON: {json_file}")
+                # Keep backup, mark original as problematic
+                os.rename(json_file, f"{json_file}.corrupted")
+                shutil.move(backup_file, json_file)
+                return 'error'
+                
+        except Exception as e:
+            self.logger.error(f"Error processing {json_file}: {e}")
+            self.banner.show_error(f"Error processing {json_file}: {e}")
+            # Restore backup if it exists
+            backup_file = f"{json_file}.backup"
+            if os.path.exists(backup_file):
+                try:
+                    shutil.move(backup_file, json_file)
+                    self.logger.debug(f"Restored backup for {json_file}")
+                except Exception as restore_error:
+                    self.logger.error(f"Failed to restore backup: {restore_error}")
+            return 'error'
+
+    def _remove_backup(self, backup_file):
+        """Remove a cleanup backup file if it is still there"""
+        try:
+            os.remove(backup_file)
+        except FileNotFoundError:
+            pass
+
     def _fix_malformed_json(self, content, filename):
-        """Fix malformed JSON content from append operations"""
+        """Fix malformed JSON content from append operations - returns the parsed data or None"""
         self.logger.debug(f"Attempting to fix malformed JSON in {filename}")
         
         try:
@@ -199,8 +267,13 @@ class JSONToMermaidConverter:
             
             # Handle case where content starts with valid JSON array
             if content.startswith('[') and content.endswith(']'):
-                self.logger.debug("Content appears to be a valid JSON array")
-                return content
+                self.logger.debug("Content appears to be a JSON array")
+                try:
+                    return _json_loads(content)
+                except json.JSONDecodeError as e:
+                    # Don't let recovery salvage part of it - the caller keeps the original file
+                    self.logger.debug(f"Array content is not valid JSON: {e}")
+                    return None
             
             # Handle multiple JSON objects appended together
             if content.startswith('{'):
@@ -211,25 +284,28 @@ class JSONToMermaidConverter:
                 if '}{' in content:
                     self.logger.debug("Found concatenated objects pattern '}{', trying simple fix")
                     fixed = '[' + content.replace('}{', '},{') + ']'
-                    # Quick validation
                     try:
-                        json.loads(fixed)
+                        parsed = _json_loads(fixed)
                         self.logger.debug("Simple concatenation fix successful")
-                        return fixed
+                        return parsed
                     except Exception as e:
                         self.logger.debug(f"Simple fix failed: {e}")
                 
                 # Method 2: More robust parsing for complex cases
                 self.logger.debug("Trying robust JSON object parsing")
                 fixed = self._parse_concatenated_json_objects(content)
-                if fixed:
+                if fixed is not None:
                     self.logger.debug("Robust parsing successful")
                     return fixed
             
             # Handle case where content is a single object
             if content.startswith('{') and content.endswith('}'):
                 self.logger.debug("Content is a single JSON object, wrapping in array")
-                return '[' + content + ']'
+                try:
+                    return [_json_loads(content)]
+                except json.JSONDecodeError as e:
+                    self.logger.debug(f"Single object is not valid JSON: {e}")
+                    return None
             
             # If all else fails, try to salvage what we can
             self.logger.warning(f"Complex JSON structure in {filename}, attempting recovery...")
@@ -265,9 +341,8 @@ class JSONToMermaidConverter:
                     break
             
             if objects:
-                result = json.dumps(objects)
                 self.logger.debug(f"Successfully parsed {len(objects)} JSON objects")
-                return result
+                return objects
             else:
                 self.logger.warning("No valid JSON objects found during parsing")
             
@@ -283,8 +358,6 @@ class JSONToMermaidConverter:
         
         try:
             # Try to find complete JSON objects using regex
-            import re
-            
             # Find JSON object patterns
             json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
             matches = re.findall(json_pattern, content)
@@ -302,9 +375,8 @@ class JSONToMermaidConverter:
                     continue
             
             if valid_objects:
-                result = json.dumps(valid_objects)
                 self.logger.warning(f"JSON recovery successful: salvaged {len(valid_objects)} objects")
-                return result
+                return valid_objects
             else:
                 self.logger.error("JSON recovery failed: no valid objects found")
                 
@@ -316,21 +388,33 @@ class JSONToMermaidConverter:
 
     def generate_unique_id(self, base_name: str) -> str:
         """Generate unique IDs to avoid conflicts"""
-        clean_name = re.sub(r'[^\w]', '_', base_name)
-        clean_name = re.sub(r'_+', '_', clean_name).strip('_')
-        
-        if clean_name not in self.used_ids:
-            self.used_ids.add(clean_name)
-            self.logger.debug(f"Generated unique ID: {clean_name}")
+        # Fast path: ASCII words joined by single underscores are already clean
+        if _CLEAN_ID_RE.fullmatch(base_name):
+            clean_name = base_name
+        else:
+            clean_name = _NON_WORD_RE.sub('_', base_name)
+            clean_name = _MULTI_UNDERSCORE_RE.sub('_', clean_name).strip('_')
+        
+        # Every handed-out id is a key; the value is the last suffix issued for that base
+        id_counter = self._id_counter
+        counter = id_counter.get(clean_name)
+        if counter is None:
+            id_counter[clean_name] = 0
+            if self._debug_on:
+                self.logger.debug(f"Generated unique ID: {clean_name}")
             return clean_name
         
-        counter = 1
-        while f"{clean_name}_{counter}" in self.used_ids:
+        # Resume from the last suffix handed out for this base instead of rescanning
+        while True:
             counter += 1
+            unique_id = f"{clean_name}_{counter}"
+            if unique_id not in id_counter:
+                break
         
-        unique_id = f"{clean_name}_{counter}"
-        self.used_ids.add(unique_id)
-        self.logger.debug(f"Generated unique ID with counter: {unique_id}")
+        id_counter[clean_name] = counter
+        id_counter[unique_id] = 0
+        if self._debug_on:
+            self.logger.debug(f"Generated unique ID with counter: {unique_id}")
         return unique_id
     
     # def extract_domain(self, url: str) -> str:
@@ -366,12 +450,14 @@ class JSONToMermaidConverter:
             if domain not in reorganized:
                 reorganized[domain] = {
                     'source_url': source_url,
-                    'categories': defaultdict(set)
+                    'categories': defaultdict(list)
                 }
-                self.logger.debug(f"Created new domain entry: {domain}")
+                if self._debug_on:
+                    self.logger.debug(f"Created new domain entry: {domain}")
             
             js_files = source_data.get('js_files', {})
-            self.logger.debug(f"Processing {len(js_files)} JS files for {domain}")
+            if self._debug_on:
+                self.logger.debug(f"Processing {len(js_files)} JS files for {domain}")
             
             # Reorganize: collect all endpoints by category - no JS links
             for js_url, js_data in js_files.items():
@@ -380,20 +466,19 @@ class JSONToMermaidConverter:
                 for category, endpoints in categories.items():
                     if not endpoints:
                         continue
-                        
-                    for endpoint in endpoints:
-                        # Just store the endpoint in the category set (deduplication)
-                        reorganized[domain]['categories'][category].add(endpoint)
+                    
+                    # Collect now, deduplicate once per category below
+                    reorganized[domain]['categories'][category].extend(endpoints)
         
-        # Convert sets to lists for easier iteration
+        # Deduplicate endpoints (keeping first-seen order)
         total_endpoints = 0
         for domain, domain_data in reorganized.items():
-            domain_endpoints = 0
-            for category in domain_data['categories']:
-                category_count = len(domain_data['categories'][category])
-                domain_data['categories'][category] = list(domain_data['categories'][category])
-                domain_endpoints += category_count
-                total_endpoints += category_count
+            domain_data['categories'] = {
+                category: list(dict.fromkeys(endpoints))
+                for category, endpoints in domain_data['categories'].items()
+            }
+            domain_endpoints = sum(len(endpoints) for endpoints in domain_data['categories'].values())
+            total_endpoints += domain_endpoints
             
             self.logger.verbose(f"Domain {domain}: {len(domain_data['categories'])} categories, {domain_endpoints} endpoints")
         
@@ -415,7 +500,8 @@ class JSONToMermaidConverter:
         mermaid_lines.append(connection)
         self.edge_count += 1
         self.text_size += estimated_size
-        self.logger.debug(f"Added edge ({self.edge_count}/{self.max_edges}): {connection[:50]}...")
+        if self._debug_on:
+            self.logger.debug(f"Added edge ({self.edge_count}/{self.max_edges}): {connection[:50]}...")
         return True
     
     def add_node(self, mermaid_lines, node_definition):
@@ -427,7 +513,32 @@ class JSONToMermaidConverter:
             
         mermaid_lines.append(node_definition)
         self.text_size += estimated_size
-        self.logger.debug(f"Added node (text size: {self.text_size}/{self.max_text_size}): {node_definition[:50]}...")
+        if self._debug_on:
+            self.logger.debug(f"Added node (text size: {self.text_size}/{self.max_text_size}): {node_definition[:50]}...")
+        return True
+    
+    @staticmethod
+    def _class_line(node_ids, style):
+        """Build a 'class a,b,c style' assignment line"""
+        return '    class ' + ','.join(node_ids) + ' ' + style
+
+    def add_node_and_edge(self, mermaid_lines, node_definition, connection):
+        """Add a node together with its incoming edge - one limit check for both"""
+        if self.edge_count >= self.max_edges:
+            self.logger.warning(f"Reached maximum edge limit: {self.max_edges}")
+            return False
+        
+        estimated_size = len(node_definition) + len(connection) + 2  # +2 for newlines
+        if self.text_size + estimated_size > self.max_text_size:
+            self.logger.warning(f"Reached maximum text size limit: {self.max_text_size}")
+            return False
+        
+        mermaid_lines.append(node_definition)
+        mermaid_lines.append(connection)
+        self.edge_count += 1
+        self.text_size += estimated_size
+        if self._debug_on:
+            self.logger.debug(f"Added node and edge ({self.edge_count}/{self.max_edges}): {node_definition[:50]}...")
         return True
     
     def get_category_priority(self, category):
@@ -439,12 +550,18 @@ class JSONToMermaidConverter:
         else:
             priority = 3
         
-        self.logger.debug(f"Category '{category}' has priority level {priority}")
+        if self._debug_on:
+            self.logger.debug(f"Category '{category}' has priority level {priority}")
         return priority
     
     def prioritize_endpoints(self, endpoints, max_endpoints=10):
         """Prioritize endpoints by security relevance"""
-        self.logger.debug(f"Prioritizing {len(endpoints)} endpoints (max: {max_endpoints})")
+        if self._debug_on:
+            self.logger.debug(f"Prioritizing {len(endpoints)} endpoints (max: {max_endpoints})")
+        
+        # Everything fits - nothing to rank or drop
+        if len(endpoints) <= max_endpoints:
+            return endpoints
         
         # Security-relevant endpoint patterns (high priority)
         high_priority_patterns = [
@@ -475,31 +592,46 @@ class JSONToMermaidConverter:
             
             return 3
         
-        # Sort by priority, then limit
-        prioritized = sorted(endpoints, key=get_content_priority)
-        result = prioritized[:max_endpoints]
+        # Pick the top endpoints by priority (stable, same as sorting then slicing)
+        result = heapq.nsmallest(max_endpoints, endpoints, key=get_content_priority)
         
         if len(result) < len(endpoints):
-            self.logger.debug(f"Prioritized {len(result)} endpoints from {len(endpoints)} total")
+            if self._debug_on:
+                self.logger.debug(f"Prioritized {len(result)} endpoints from {len(endpoints)} total")
         
         return result
 
     def create_flowchart_with_proper_hierarchy(self, data: Any) -> str:
         """Create prioritized left-to-right flowchart with Domain -> Category -> Category hierarchy"""
+        buffer = io.StringIO()
+        if not self.create_flowchart_stream(data, buffer):
+            return "Error: Diagram too large"
+        return buffer.getvalue()
+
+    def create_flowchart_stream(self, data: Any, out) -> bool:
+        """Write the hierarchy flowchart to a text stream line by line, returns False if it could not be started"""
         self.logger.info("Creating flowchart with proper hierarchy")
         
-        self.used_ids = set()
+        self._id_counter = {}
         self.edge_count = 0
         self.text_size = 0
         
+        # Check for data before anything is written, so an empty chart stays a complete diagram
+        reorganized_data = self.reorganize_data_by_hierarchy(data)
+        
+        if not reorganized_data:
+            self.logger.warning("No data available for flowchart generation")
+            out.write("flowchart LR\n    START([No data available])\n")
+            return True
+        
         # Start the flowchart with left-to-right layout
-        mermaid_lines = []
+        mermaid_lines = _LineStream(out)
         if not self.add_node(mermaid_lines, 'flowchart LR'):
             self.logger.error("Failed to add flowchart declaration")
-            return "Error: Diagram too large"
+            return False
         if not self.add_node(mermaid_lines, '    START([Website Map])'):
             self.logger.error("Failed to add START node")
-            return "Error: Diagram too large"
+            return False
         self.add_node(mermaid_lines, '')
         
         # Add CSS classes for styling
@@ -516,38 +648,39 @@ class JSONToMermaidConverter:
             if not self.add_node(mermaid_lines, line):
                 break
         
-        reorganized_data = self.reorganize_data_by_hierarchy(data)
-        
-        if not reorganized_data:
-            self.logger.warning("No data available for flowchart generation")
-            return "flowchart LR\n    START([No data available])\n"
-        
         domain_nodes = []
         category_nodes = []
         content_nodes = []
         high_priority_nodes = []
         
         for domain, domain_data in reorganized_data.items():
-            self.logger.debug(f"Processing domain: {domain}")
+            if self._debug_on:
+                self.logger.debug(f"Processing domain: {domain}")
             
             # Create domain node
             domain_id = self.generate_unique_id(f"domain_{domain}")
-            if not self.add_node(mermaid_lines, f'    {domain_id}["{domain}"]'):
-                break
-            if not self.add_edge(mermaid_lines, f'    START --> {domain_id}'):
+            if not self.add_node_and_edge(mermaid_lines,
+                                          self._NODE_TMPL % (domain_id, domain),
+                                          self._EDGE_TMPL % ('START', domain_id)):
                 break
             domain_nodes.append(domain_id)
             
             categories = domain_data['categories']
-            self.logger.debug(f"Domain {domain} has {len(categories)} categories")
+            if self._debug_on:
+                self.logger.debug(f"Domain {domain} has {len(categories)} categories")
             
-            # Sort categories by priority
-            sorted_categories = sorted(categories.items(), 
-                                     key=lambda x: (self.get_category_priority(x[0]), -len(x[1])))
+            # Sort categories by priority - bucket by priority level, then by endpoint count
+            priority_buckets = ([], [], [])
+            for category, endpoints in categories.items():
+                priority_buckets[self._priority_map.get(category, 3) - 1].append((category, endpoints))
+            for bucket in priority_buckets:
+                bucket.sort(key=lambda x: -len(x[1]))
+            sorted_categories = priority_buckets[0] + priority_buckets[1] + priority_buckets[2]
             
             # Limit categories based on space
             max_categories = 15 if self.text_size < self.max_text_size * 0.3 else 8
-            self.logger.debug(f"Using max_categories: {max_categories} for domain {domain}")
+            if self._debug_on:
+                self.logger.debug(f"Using max_categories: {max_categories} for domain {domain}")
             
             for category, endpoints in sorted_categories[:max_categories]:
                 if not endpoints:
@@ -556,17 +689,19 @@ class JSONToMermaidConverter:
                 # Skip low priority categories if we're running out of space
                 if (self.text_size > self.max_text_size * 0.6 and 
                     self.get_category_priority(category) == 3):
-                    self.logger.debug(f"Skipping low priority category '{category}' due to space constraints")
+                    if self._debug_on:
+                        self.logger.debug(f"Skipping low priority category '{category}' due to space constraints")
                     continue
                 
-                self.logger.debug(f"Processing category '{category}' with {len(endpoints)} endpoints")
+                if self._debug_on:
+                    self.logger.debug(f"Processing category '{category}' with {len(endpoints)} endpoints")
                 
                 # Create category node
                 cat_id = self.generate_unique_id(f"cat_{category}_{domain}")
-                cat_display = category.replace('_', ' ').title()
-                if not self.add_node(mermaid_lines, f'    {cat_id}["{cat_display}"]'):
-                    break
-                if not self.add_edge(mermaid_lines, f'    {domain_id} --> {cat_id}'):
+                cat_display = _category_display(category)
+                if not self.add_node_and_edge(mermaid_lines,
+                                              self._NODE_TMPL % (cat_id, cat_display),
+                                              self._EDGE_TMPL % (domain_id, cat_id)):
                     break
                 category_nodes.append(cat_id)
                 
@@ -585,13 +720,14 @@ class JSONToMermaidConverter:
                     content_id = self.generate_unique_id(f"ep_{category}_{domain}")
                     
                     # Truncate very long endpoints for text size
-                    content_clean = str(endpoint).replace('[', '').replace(']', '').replace('"', "'")
+                    content_clean = endpoint if isinstance(endpoint, str) else str(endpoint)
+                    content_clean = content_clean.translate(_ENDPOINT_LABEL_TABLE)
                     if len(content_clean) > 50:
                         content_clean = content_clean[:47] + "..."
                     
-                    if not self.add_node(mermaid_lines, f'    {content_id}["{content_clean}"]'):
-                        break
-                    if not self.add_edge(mermaid_lines, f'    {cat_id} --> {content_id}'):
+                    if not self.add_node_and_edge(mermaid_lines,
+                                                  self._NODE_TMPL % (content_id, content_clean),
+                                                  self._EDGE_TMPL % (cat_id, content_id)):
                         break
                     
                     # Mark high priority endpoints
@@ -608,8 +744,9 @@ class JSONToMermaidConverter:
                 if len(endpoints) > len(prioritized_endpoints):
                     more_id = self.generate_unique_id(f"more_{category}_{domain}")
                     remaining = len(endpoints) - len(prioritized_endpoints)
-                    if self.add_node(mermaid_lines, f'    {more_id}["...+{remaining} more"]'):
-                        self.add_edge(mermaid_lines, f'    {cat_id} --> {more_id}')
+                    if self.add_node_and_edge(mermaid_lines,
+                                              self._NODE_TMPL % (more_id, f"...+{remaining} more"),
+                                              self._EDGE_TMPL % (cat_id, more_id)):
                         category_nodes.append(more_id)
                 
                 if self.edge_count >= self.max_edges or self.text_size >= self.max_text_size:
@@ -619,8 +756,9 @@ class JSONToMermaidConverter:
             if len(categories) > max_categories:
                 more_cat_id = self.generate_unique_id(f"more_cats_{domain}")
                 remaining_cats = len(categories) - max_categories
-                if self.add_node(mermaid_lines, f'    {more_cat_id}["...+{remaining_cats} more categories"]'):
-                    self.add_edge(mermaid_lines, f'    {domain_id} --> {more_cat_id}')
+                if self.add_node_and_edge(mermaid_lines,
+                                          self._NODE_TMPL % (more_cat_id, f"...+{remaining_cats} more categories"),
+                                          self._EDGE_TMPL % (domain_id, more_cat_id)):
                     category_nodes.append(more_cat_id)
             
             if self.edge_count >= self.max_edges or self.text_size >= self.max_text_size:
@@ -636,22 +774,18 @@ class JSONToMermaidConverter:
             if self.text_size >= self.max_text_size:
                 warning_msg += f"<br/>Text size limit reached"
             
-            if self.add_node(mermaid_lines, f'    WARNING["{warning_msg}"]'):
+            if self.add_node(mermaid_lines, self._NODE_TMPL % ('WARNING', warning_msg)):
                 self.add_edge(mermaid_lines, '    START --> WARNING')
         
         # Apply CSS classes
         self.add_node(mermaid_lines, '')
         self.add_node(mermaid_lines, '    %% Apply styles')
-        if domain_nodes:
-            self.add_node(mermaid_lines, f'    class {",".join(domain_nodes)} domainStyle')
-        if category_nodes:
-            self.add_node(mermaid_lines, f'    class {",".join(category_nodes)} categoryStyle')
-        if content_nodes:
-            self.add_node(mermaid_lines, f'    class {",".join(content_nodes)} endpointStyle')
-        if high_priority_nodes:
-            self.add_node(mermaid_lines, f'    class {",".join(high_priority_nodes)} highPriority')
-        
-        final_flowchart = '\n'.join(mermaid_lines)
+        for node_ids, style in ((domain_nodes, 'domainStyle'),
+                                (category_nodes, 'categoryStyle'),
+                                (content_nodes, 'endpointStyle'),
+                                (high_priority_nodes, 'highPriority')):
+            if node_ids:
+                self.add_node(mermaid_lines, self._class_line(node_ids, style))
         
         self.logger.info(f"Flowchart generation complete:")
         self.logger.info(f"  - Total lines: {len(mermaid_lines)}")
@@ -662,12 +796,12 @@ class JSONToMermaidConverter:
         self.logger.info(f"  - Content nodes: {len(content_nodes)}")
         self.logger.info(f"  - High priority nodes: {len(high_priority_nodes)}")
         
-        return final_flowchart
+        return True
    
     def create_flowchart(self, data: Any) -> str:
         """Create a flowchart showing the structure with proper hierarchy"""
         self.logger.debug("Starting flowchart creation")
-        self.used_ids = set()  # Reset IDs for each conversion
+        self._id_counter = {}  # Reset IDs for each conversion
         
         # Handle your tool's detailed JSON format (contents_detailed.json)
         if isinstance(data, dict) and 'contents_by_source' in data:
@@ -697,8 +831,7 @@ class JSONToMermaidConverter:
         """Create simple left-to-right flowchart for stats format"""
         self.logger.debug("Creating simple stats flowchart")
         
-        mermaid = 'flowchart LR\n'
-        mermaid += '    START([Website Map])\n'
+        parts = ['flowchart LR', '    START([Website Map])']
         
         categories = data.get('categories', {})
         overall = data.get('overall', {})
@@ -708,49 +841,63 @@ class JSONToMermaidConverter:
         
         self.logger.debug(f"Stats overview: {total_endpoints} endpoints, {total_js} JS files")
         
-        overview_id = self.generate_unique_id('overview')
-        mermaid += f'    {overview_id}["Total: {total_endpoints} endpoints<br/>{total_js} JS files"]\n'
-        mermaid += f'    START --> {overview_id}\n'
+        # Bind hot lookups once, the loop below runs per category
+        gen_id = self.generate_unique_id
+        debug = self.logger.debug
+        debug_on = self._debug_on
+        append = parts.append
+        
+        overview_id = gen_id('overview')
+        append(f'    {overview_id}["Total: {total_endpoints} endpoints<br/>{total_js} JS files"]')
+        append(f'    START --> {overview_id}')
         
         for category, count in categories.items():
-            cat_id = self.generate_unique_id(f"cat_{category}")
-            cat_display = category.replace('_', ' ').title()
-            mermaid += f'    {cat_id}["{cat_display}<br/>{count} endpoints"]\n'
-            mermaid += f'    {overview_id} --> {cat_id}\n'
-            self.logger.debug(f"Added stats category: {cat_display} ({count} endpoints)")
+            cat_id = gen_id(f"cat_{category}")
+            cat_display = _category_display(category)
+            append(f'    {cat_id}["{cat_display}<br/>{count} endpoints"]')
+            append(f'    {overview_id} --> {cat_id}')
+            if debug_on:
+                debug(f"Added stats category: {cat_display} ({count} endpoints)")
         
         self.logger.info(f"Simple stats flowchart created with {len(categories)} categories")
-        return mermaid
+        return '\n'.join(parts) + '\n'
     
     def create_simple_list_flowchart(self, data: List) -> str:
         """Create simple left-to-right flowchart for list format"""
         self.logger.debug(f"Creating simple list flowchart for {len(data)} items")
         
-        mermaid = 'flowchart LR\n'
-        mermaid += '    START([Website Map])\n'
+        parts = ['flowchart LR', '    START([Website Map])']
+        
+        # Bind hot lookups once, the loops below run per item and per category
+        gen_id = self.generate_unique_id
+        debug = self.logger.debug
+        debug_on = self._debug_on
+        append = parts.append
         
         for i, item in enumerate(data):
             overall = item.get('overall', {})
             total_endpoints = overall.get('total_endpoints', 0)
             total_js = overall.get('total_js_files', 0)
            
-            self.logger.debug(f"List item {i+1}: {total_endpoints} endpoints, {total_js} JS files")
+            if debug_on:
+                debug(f"List item {i+1}: {total_endpoints} endpoints, {total_js} JS files")
            
-            analysis_id = self.generate_unique_id(f"Analysis_{i}")
-            mermaid += f'    {analysis_id}["Analysis {i+1}<br/>{total_endpoints} endpoints<br/>{total_js} JS files"]\n'
-            mermaid += f'    START --> {analysis_id}\n'
+            analysis_id = gen_id(f"Analysis_{i}")
+            append(f'    {analysis_id}["Analysis {i+1}<br/>{total_endpoints} endpoints<br/>{total_js} JS files"]')
+            append(f'    START --> {analysis_id}')
            
             # Add categories
             categories = item.get('categories', {})
             for cat, count in categories.items():
-                cat_clean = cat.replace('_', ' ').title()
-                cat_id = self.generate_unique_id(f"{cat}_{i}")
-                mermaid += f'    {cat_id}["{cat_clean}<br/>{count}"]\n'
-                mermaid += f'    {analysis_id} --> {cat_id}\n'
-                self.logger.debug(f"Added list category: {cat_clean} ({count} items)")
+                cat_clean = _category_display(cat)
+                cat_id = gen_id(f"{cat}_{i}")
+                append(f'    {cat_id}["{cat_clean}<br/>{count}"]')
+                append(f'    {analysis_id} --> {cat_id}')
+                if debug_on:
+                    debug(f"Added list category: {cat_clean} ({count} items)")
         
         self.logger.info(f"Simple list flowchart created for {len(data)} analyses")
-        return mermaid
+        return '\n'.join(parts) + '\n'
    
     def convert_to_flowchart(self, json_data: Any) -> str:
         """Main conversion method"""
@@ -760,7 +907,7 @@ class JSONToMermaidConverter:
         if isinstance(json_data, str):
             self.logger.debug("Input is string, parsing JSON")
             try:
-                data = json.loads(json_data)
+                data = _json_loads(json_data)
                 self.logger.debug("JSON parsing successful")
             except json.JSONDecodeError as e:
                 error_msg = f"Error parsing JSON: {e}"
@@ -773,7 +920,89 @@ class JSONToMermaidConverter:
         result = self.create_flowchart(data)
         self.logger.info("Flowchart conversion completed successfully")
         return result
+
+    def write_flowchart(self, data: Any, out) -> bool:
+        """Write the flowchart for already parsed data to a text stream, returns False on failure"""
+        # The hierarchy view is the one that gets large, stream it instead of joining it in memory
+        detailed = None
+        if isinstance(data, dict) and 'contents_by_source' in data:
+            detailed = data
+        elif isinstance(data, list) and len(data) > 0 and 'contents_by_source' in data[0]:
+            detailed = data[0]
+        
+        if detailed is not None:
+            # Nothing was found for this domain - no need to walk the converter at all
+            if not detailed['contents_by_source']:
+                self.logger.debug("No content sources in detailed JSON, writing empty flowchart")
+                out.write(self._EMPTY_FLOWCHART)
+                return True
+            self._id_counter = {}
+            return self.create_flowchart_stream(detailed, out)
+        
+        result = self.create_flowchart(data)
+        if result.startswith("Error:"):
+            self.logger.error(result)
+            return False
+        out.write(result)
+        return True
     
+    def _slim_detailed_node(self, node):
+        """Materialize a parsed simdjson node, keeping only contents_by_source for detailed results"""
+        if isinstance(node, simdjson.Object):
+            if 'contents_by_source' in node:
+                return {'contents_by_source': node['contents_by_source'].as_dict()}
+            return node.as_dict()
+        if isinstance(node, simdjson.Array):
+            return node.as_list()
+        return node
+
+    def _load_detailed_json(self, json_file):
+        """Load a detailed JSON file for flowchart generation"""
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+        
+        if self._simdjson_parser is None:
+            return _json_loads(raw)
+        
+        # The flowchart never reads metadata/contents_summary - skip building them
+        doc = self._simdjson_parser.parse(raw)
+        if isinstance(doc, simdjson.Array) and len(doc) > 0:
+            first_item = doc[0]
+            if isinstance(first_item, simdjson.Object) and 'contents_by_source' in first_item:
+                # Only the first appended result is charted for the list format
+                return [self._slim_detailed_node(first_item)]
+        return self._slim_detailed_node(doc)
+
+    def _render_domain(self, paths):
+        """Render a domain's saved Mermaid file to SVG and PNG - returns True if both succeeded"""
+        domain = paths.domain
+        output_files = {'svg': paths.svg, 'png': paths.png}
+        
+        try:
+            self.logger.debug(f"Rendering SVG and PNG diagrams for {domain}")
+            results = self.mermaid_cli.render_many(paths.mmd, list(output_files.values()))
+        except Exception as render_error:
+            self.logger.error(f"Error rendering diagrams for {domain}: {render_error}")
+            return False
+        
+        render_success = True
+        for ext, output_file in output_files.items():
+            output_size = None
+            if results.get(output_file):
+                try:
+                    output_size = os.stat(output_file).st_size
+                except FileNotFoundError:
+                    pass
+            
+            if output_size is not None:
+                self.logger.success(f"Successfully rendered {ext.upper()}: {output_file} ({output_size} bytes)")
+                self.banner.add_status(f"Rendered: {output_file}", "success")
+            else:
+                self.logger.warning(f"Failed to render {ext.upper()}: {output_file}")
+                render_success = False
+        
+        return render_success
+
     def generate_mermaid(self, urls):
         """Generate Mermaid flowcharts"""
         self.logger.info("Starting Mermaid flowchart generation process")
@@ -791,9 +1020,18 @@ class JSONToMermaidConverter:
         diagrams_created = 0
         diagrams_failed = 0
         processed_urls = 0
+        render_jobs = {}  # domain -> DomainPaths (one render per domain)
 
         self.banner.update_status("CONVERTING TO MERMAID FORMAT...")
         
+        # One directory listing up front - domains without output need no per-file stat
+        try:
+            with os.scandir(config.OUTPUT_DIR) as entries:
+                domain_dirs = {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            domain_dirs = set()
+        
+        seen_domains = set()
         for url in urls:
             processed_urls += 1
             domain = self.domain_handler.extract_domain(url)
@@ -801,74 +1039,58 @@ class JSONToMermaidConverter:
                 self.logger.warning(f"Could not extract domain from URL: {url}")
                 continue
             
+            # Output is per domain - several URLs on one host share a single flowchart
+            if domain in seen_domains:
+                self.logger.debug(f"Flowchart already generated for domain: {domain}")
+                continue
+            seen_domains.add(domain)
+            
             self.logger.debug(f"Processing Mermaid generation for domain: {domain}")
             
-            json_file = f"{config.OUTPUT_DIR}/{domain}/{domain}_{self.template}_detailed.json"
+            if domain not in domain_dirs:
+                self.logger.debug(f"No output directory for domain: {domain}")
+                continue
             
-            if not os.path.exists(json_file):
+            paths = self.domain_handler.get_domain_paths(domain, self.template)
+            json_file = paths.detailed_file
+            
+            try:
+                json_size = os.stat(json_file).st_size
+            except FileNotFoundError:
                 self.logger.debug(f"JSON file does not exist: {json_file}")
                 continue
                 
-            if os.path.getsize(json_file) == 0:
+            if json_size == 0:
                 self.logger.debug(f"JSON file is empty: {json_file}")
                 continue
             
-            self.logger.verbose(f"Processing JSON file: {json_file} ({os.path.getsize(json_file)} bytes)")
+            self.logger.verbose(f"Processing JSON file: {json_file} ({json_size} bytes)")
             
             try:
                 # Load and parse JSON data
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
+                json_data = self._load_detailed_json(json_file)
                 
                 self.logger.debug(f"Successfully loaded JSON data for {domain}")
                 
-                # Convert to Mermaid format
-                mermaid_output = self.convert_to_flowchart(json_data)
+                # Convert to Mermaid format, streaming straight into the .mmd file
+                mermaid_file = paths.mmd
                 
-                if mermaid_output.startswith("Error:") or "Error parsing JSON:" in mermaid_output:
-                    self.logger.error(f"Flowchart conversion failed for {domain}: {mermaid_output}")
+                with open(mermaid_file, 'w', encoding='utf-8', newline='', buffering=config.WRITE_BUFFER_SIZE) as f:
+                    written = self.write_flowchart(json_data, f)
+                    mermaid_size = f.tell()
+                
+                if not written:
+                    self.logger.error(f"Flowchart conversion failed for {domain}")
+                    os.remove(mermaid_file)
                     diagrams_failed += 1
                     continue
                 
-                # Save Mermaid file
-                mermaid_file = f"{config.OUTPUT_DIR}/{domain}/{domain}_{self.template}_flowchart.mmd"
-                
-                with open(mermaid_file, 'w', encoding='utf-8') as f:
-                    f.write(mermaid_output)
-                
-                mermaid_size = len(mermaid_output)
                 self.logger.success(f"Saved Mermaid file: {mermaid_file} ({mermaid_size} bytes)")
                 self.banner.add_status(f"Mermaid saved: {mermaid_file}")
                 
-                time.sleep(1)
-                
-                # Render to SVG/PNG
-                render_success = True
-                for ext in ['svg', 'png']:
-                    output_file = f"{config.OUTPUT_DIR}/{domain}/{domain}_{self.template}_flowchart.{ext}"
-                    
-                    try:
-                        self.logger.debug(f"Rendering {ext.upper()} diagram: {output_file}")
-                        success = self.mermaid_cli.render(mermaid_file, output_file)
-                        
-                        if success and os.path.exists(output_file):
-                            output_size = os.path.getsize(output_file)
-                            self.logger.success(f"Successfully rendered {ext.upper()}: {output_file} ({output_size} bytes)")
-                            self.banner.show_completion(f"Rendered: {output_file}")
-                        else:
-                            self.logger.warning(f"Failed to render {ext.upper()}: {output_file}")
-                            render_success = False
-                            
-                    except Exception as render_error:
-                        self.logger.error(f"Error rendering {ext.upper()} for {domain}: {render_error}")
-                        render_success = False
-                
-                if render_success:
-                    diagrams_created += 1
-                else:
-                    diagrams_failed += 1
+                render_jobs[domain] = paths
                     
-            except json.JSONDecodeError as e:
+            except ValueError as e:  # decode errors from json, orjson and simdjson
                 self.logger.error(f"JSON decode error for {domain}: {e}")
                 self.banner.add_status(f"JSON error for {domain}: {e}")
                 diagrams_failed += 1
@@ -877,8 +1099,18 @@ class JSONToMermaidConverter:
                 self.logger.error(f"Unexpected error processing {domain}: {e}")
                 self.banner.add_status(f"Mermaid error for {domain}: {e}")
                 diagrams_failed += 1
-                
-            time.sleep(1)
+
+        # Render to SVG/PNG - each render is its own mmdc process, so domains can run side by side.
+        # Every domain starts an SVG and a PNG render (headless Chromium each), so keep the pool small
+        if len(render_jobs) > 1 and config.MERMAID_RENDER_WORKERS > 1:
+            with ThreadPoolExecutor(max_workers=config.MERMAID_RENDER_WORKERS) as executor:
+                futures = [executor.submit(self._render_domain, paths) for paths in render_jobs.values()]
+                render_results = [future.result() for future in as_completed(futures)]
+        else:
+            render_results = [self._render_domain(paths) for paths in render_jobs.values()]
+        
+        diagrams_created += render_results.count(True)
+        diagrams_failed += render_results.count(False)
 
         # Log final statistics
         self.logger.info(f"Mermaid generation completed:")
@@ -892,6 +1124,4 @@ class JSONToMermaidConverter:
             
         if diagrams_failed > 0:
             self.logger.warning(f"Failed to create diagrams for {diagrams_failed} domains")
-            self.banner.show_completion(f"{diagrams_failed} diagrams failed to generate")
-            
-        time.sleep(3)
\ No newline at end of file
+            self.banner.show_completion(f"{diagrams_failed} diagrams failed to generate")
\ No newline at end of file
@@ -1,4 +1,6 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from src import config
 from src.utils.Logger import get_logger
 
@@ -13,10 +15,30 @@ class URLProcessor:
         self.template = template_name
         self.logger = get_logger()
 
+        # One JS fetch pool for the whole run - worker threads are reused across URLs
+        self._js_executor = ThreadPoolExecutor(max_workers=config.JS_FETCH_WORKERS)
+
+        # Output directories already created this run
+        self._created_dirs = set()
+
+        # Pages of upcoming URLs are fetched here while the current URL is analyzed
+        self._page_executor = ThreadPoolExecutor(max_workers=1)
+        self._page_fetches = {}  # url -> Future of its HTML
+
 
 
     def process_url(self, url, templates):
         """Process a single URL - only create output if content is found"""
+        # Claim this URL's prefetch up front so no return or exception can leave it queued
+        prefetched = self._page_fetches.pop(url, None)
+        try:
+            return self._process_url(url, templates, prefetched)
+        finally:
+            if prefetched is not None:
+                prefetched.cancel()  # no-op once it has been collected
+
+    def _process_url(self, url, templates, prefetched):
+        """process_url body - prefetched is the page's in-flight fetch, if any"""
         self.logger.debug(f"Processing URL: {url}")
         
 
@@ -32,23 +54,17 @@ class URLProcessor:
         self.category_processor.reset_for_new_url()
         self.category_processor.templates_by_category = templates
         self.logger.debug(f"Reset category processor with {len(templates)} templates for {domain}")
-        
-        # Fetch and process HTML
-        self.banner.add_status(f"Fetching content from {domain}...")
-        self.logger.verbose(f"Fetching content from {url}...")
 
-        html_content = self.webrequests.fetch_url_content(self.webrequests.add_protocol_if_missing(url))
+        # Nothing to match against - don't fetch the page or any JS
+        if not any(templates.values()):
+            self.logger.warning(f"No template patterns to search {domain} with - skipping")
+            return False
+        
+        # Fetch and process HTML (already in flight if it was prefetched)
+        html_content = self._fetch_page(url, prefetched)
         if not html_content:
-            self.banner.show_warning(f"Failed to fetch content from {url} trying again without user-agents")
-            self.logger.warning(f"First fetch attempt failed for {url} - trying again without user-agents")
-
-            html_content = self.webrequests.fetch_url_content(self.webrequests.add_protocol_if_missing(url), user_agent=None)
-            # if still nothing, then skip
-            if not html_content:
-                self.banner.add_status(f"Failed to fetch content from {url} - skipping")
-                self.logger.error(f"Second fetch attempt failed for {url} - skipping")
-                return False
-           
+            return False
+        
         
         # Extract JS links
         js_links = self.jsprocessor.extract_js_links(html_content, url)
@@ -59,35 +75,54 @@ class URLProcessor:
         total_content_found = 0
         has_any_findings = False
         js_files_processed = 0
-        je_files_with_findings = 0
+        js_files_with_findings = 0
         
         if js_links:
-            # Process each JS file
-            for i, js_link in enumerate(js_links, 1):
-                self.banner.add_status(f"Analyzing JS file {i}/{len(js_links)} from {domain}")
-                self.logger.verbose(f"Analyzing JS file {i}/{len(js_links)} from {domain}")
-                
-
-                js_content = self.webrequests.fetch_url_content(js_link)
-                if js_content:
-                    self.logger.debug(f"Fetched {len(js_content)} bytes from {js_link}")
-
-                    findings = self.jsprocessor.search_js_content_by_category_with_context(
-                        js_content, js_link, url, templates
-                    )
-                    if findings:
-                        self.category_processor.merge_categorized_results(findings)
-                        has_any_findings = True
-                        je_files_with_findings += 1
-
-                        total_findings = sum(len(matches) for matches in findings.values())
-
-                        self.banner.add_status(f"Found endpoints in {js_link}", "success")
-                        self.logger.success(f"Found endpoints in {js_link}")
-                        self.logger.debug(f"Found {total_findings} endpoints in")
-                else:
-                    self.banner.show_warning(f"Failed to fetch JS content from {js_link}")
-                    self.logger.warning(f"Failed to fetch JS content from {js_link}")
+            # Fetch all JS files concurrently; analysis and merging stay on this thread, in link order
+            js_fetches = [self._js_executor.submit(self.webrequests.fetch_url_content, js_link) for js_link in js_links]
+            debug_on = self.logger.is_debug_enabled()
+            verbose_on = self.logger.is_verbose_enabled()
+            # Report progress every ~5% (or when it's gone quiet), not once per file
+            progress_step = max(1, len(js_links) // 20)
+            last_progress = 0.0
+            try:
+                # Process each JS file
+                for i, (js_link, js_fetch) in enumerate(zip(js_links, js_fetches), 1):
+                    now = time.monotonic()
+                    if i % progress_step == 0 or i == len(js_links) or now - last_progress >= config.PROGRESS_INTERVAL:
+                        last_progress = now
+                        progress = f"Analyzing JS file {i}/{len(js_links)} from {domain}"
+                        self.banner.add_status(progress)
+                        if verbose_on:
+                            self.logger.verbose(progress)
+                    
+
+                    js_content = js_fetch.result()
+                    if js_content:
+                        js_files_processed += 1
+                        if debug_on:
+                            self.logger.debug(f"Fetched {len(js_content)} bytes from {js_link}")
+
+                        findings = self.jsprocessor.search_js_content_by_category_with_context(
+                            js_content, js_link, url, templates
+                        )
+                        if findings:
+                            self.category_processor.merge_categorized_results(findings)
+                            has_any_findings = True
+                            js_files_with_findings += 1
+
+                            self.banner.add_status(f"Found endpoints in {js_link}", "success")
+                            self.logger.success(f"Found endpoints in {js_link}")
+                            if debug_on:
+                                total_findings = sum(len(matches) for matches in findings.values())
+                                self.logger.debug(f"Found {total_findings} endpoints in")
+                    else:
+                        self.banner.show_warning(f"Failed to fetch JS content from {js_link}")
+                        self.logger.warning(f"Failed to fetch JS content from {js_link}")
+            finally:
+                # Interrupted part way - don't leave the rest downloading
+                for js_fetch in js_fetches:
+                    js_fetch.cancel()
         
         else:
             self.logger.warning(f"No JS files found in {domain}")
@@ -97,27 +132,29 @@ class URLProcessor:
         total_content_found = len(all_endpoints)
 
         # log summary
-        self.logger.log_processing_stats(domain, total_content_found, has_any_findings, je_files_with_findings, js_files_processed)
-        self.logger.verbose(f"JS files with findings: {je_files_with_findings}/{js_files_processed}")
+        self.logger.log_processing_stats(domain, total_content_found, has_any_findings, js_files_with_findings, js_files_processed)
+        self.logger.verbose(f"JS files with findings: {js_files_with_findings}/{js_files_processed}")
 
         # Only create output directory and files if we have actual findings
         if total_content_found > 0 or has_any_findings:
             self.banner.add_status(f"Creating output files for {domain}...")
             self.logger.info(f"Creating output files for {domain}...", "success")
             
+            paths = self.domain_handler.get_domain_paths(domain, self.template)
+            
             # Create the output directory (only when we have data)
-            self._ensure_output_directory(domain)
+            self._ensure_output_directory(paths.directory)
             
             # Save all the results for THIS URL only
-            self.category_processor.save_content_to_txt(all_endpoints, f"{domain}/{domain}_{self.template}_found.txt")
+            self.category_processor.save_content_to_txt(all_endpoints, paths.found)
             self.banner.add_status(f"Saved {total_content_found} endpoints for {domain}", "success")
             self.logger.success(f"Saved {total_content_found} endpoints for {domain}", "success")
             
             # Save detailed results for THIS URL only
             if self.category_processor.categorized_results or self.category_processor.detailed_results:
-                self.category_processor.save_detailed_results_to_json(f"{domain}/{domain}_{self.template}_detailed.json")
-                self.category_processor.save_flat_content_for_db(f"{domain}/{domain}_{self.template}_for_db.json")
-                self.category_processor.save_summary_stats_json(f"{domain}/{domain}_{self.template}_stats.json")
+                self.category_processor.save_detailed_results_to_json(paths.detailed)
+                self.category_processor.save_flat_content_for_db(paths.for_db)
+                self.category_processor.save_summary_stats_json(paths.stats)
                 self.banner.add_status(f"Analysis files saved for {domain}", "success")
                 self.logger.verbose(f"Analysis files saved for {domain}", "success")
             
@@ -127,8 +164,9 @@ class URLProcessor:
                 self.logger.debug(f"Saved {len(js_links)} JS links for {domain}")
             
             # Save URL content for reference
-            self.webrequests.save_url_content(url, html_content)
-            self.logger.debug(f"Saved {len(html_content)} bytes for {url}")
+            if config.SAVE_HTML_CONTENT:
+                self.webrequests.save_url_content(url, html_content)
+                self.logger.debug(f"Saved {len(html_content)} bytes for {url}")
             
             return True  # Successfully processed with findings
         else:
@@ -136,9 +174,57 @@ class URLProcessor:
             self.logger.warning(f"No endpoints found for {domain} - skipping output creation")
             return False  # No findings, no output created
     
-    def _ensure_output_directory(self, domain):
+    def prefetch_page(self, url):
+        """Start fetching a URL's page in the background so process_url does not wait on it"""
+        if url in self._page_fetches or not self.domain_handler.extract_domain(url):
+            return
+        # Runs while another URL is being processed - it reports nothing until process_url collects it
+        self._page_fetches[url] = self._page_executor.submit(self._download_page, url)
+
+    def _fetch_page(self, url, prefetched=None):
+        """Fetch a page's HTML (or collect its prefetch) and report the outcome - returns None on failure"""
+        domain = self.domain_handler.extract_domain(url)
+        self.banner.add_status(f"Fetching content from {domain}...")
+        self.logger.verbose(f"Fetching content from {url}...")
+
+        html_content, retried = prefetched.result() if prefetched else self._download_page(url)
+        if retried:
+            self.banner.show_warning(f"Failed to fetch content from {url} trying again without user-agents")
+            self.logger.warning(f"First fetch attempt failed for {url} - trying again without user-agents")
+
+            # if still nothing, then skip
+            if not html_content:
+                self.banner.add_status(f"Failed to fetch content from {url} - skipping")
+                self.logger.error(f"Second fetch attempt failed for {url} - skipping")
+                return None
+
+        return html_content
+
+    def _download_page(self, url):
+        """Fetch a page's HTML, retrying once without a user-agent - returns (html or None, whether it retried)"""
+        page_url = self.webrequests.add_protocol_if_missing(url)
+
+        # Pages are unique per run and not size capped - only JS files go through the fetch cache
+        html_content = self.webrequests.fetch_url_content(page_url, cacheable=False, max_bytes=None)
+        if html_content:
+            return html_content, False
+
+        # Goes through the same session, so the retry reuses its pooled connection
+        return self.webrequests.fetch_url_content(page_url, user_agent=None, cacheable=False, max_bytes=None), True
+
+    def close(self):
+        """Drop pending prefetches and stop the fetch threads"""
+        for page_fetch in self._page_fetches.values():
+            page_fetch.cancel()
+        self._page_fetches.clear()
+        self._page_executor.shutdown(wait=False)
+        self._js_executor.shutdown(wait=False)
+
+    def _ensure_output_directory(self, domain_output_path):
         """Create output directory for domain (only called when we have data)"""
-        domain_output_path = f"{config.OUTPUT_DIR}/{domain}"
+        if domain_output_path in self._created_dirs:
+            return
         os.makedirs(domain_output_path, exist_ok=True)
+        self._created_dirs.add(domain_output_path)
         self.banner.add_status(f"Created output directory: {domain_output_path}")
         self.logger.debug(f"Created output directory: {domain_output_path}")
\ No newline at end of file
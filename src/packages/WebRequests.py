@@ -1,13 +1,41 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import gzip
 from urllib.parse import urlparse
 from src import config
 from src.utils.Banner import Banner
 from src.utils.Logger import get_logger
 import random
+import re
+import threading
+from collections import OrderedDict
 
 jsauce_banner = Banner()
 
+# URL schemes that need no protocol added
+_PROTO_PREFIXES = ('http://', 'https://')
+
+# Characters not kept in saved page filenames (percent escapes, ':' etc. aren't portable)
+_SAFE_NAME_RE = re.compile(r'[^\w.-]')
+
+# User agent headers to rotate through, one picked per request (built once, requests doesn't modify them)
+_UA_HEADERS = tuple({'User-Agent': ua} for ua in config.USER_AGENTS)
+
+# Default for fetch_url_content's user_agent - None already means "send no user agent"
+_RANDOM_UA = object()
+
+# Fetch attempts in order: as asked, without a user agent, then plain HTTP after an SSL error
+_ATTEMPTS = (
+    {'use_ua': True, 'force_http': False},
+    {'use_ua': False, 'force_http': False},
+    {'use_ua': False, 'force_http': True},
+)
+
+# HTTP statuses worth retrying without the user agent (blocked / rate limited)
+_RETRY_STATUSES = frozenset({403, 429})
+
 class WebRequests:
     def __init__(self):
         # Create a session for connection reuse and better performance
@@ -16,100 +44,172 @@ class WebRequests:
         # Set session timeout
         self.session.timeout = config.REQUEST_TIMEOUT
 
+        # Size the connection pool for concurrent JS fetches (urllib3 keeps only 10 per host by default,
+        # extra connections get thrown away and re-handshaked) and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=config.HTTP_POOL_SIZE,
+            pool_maxsize=config.HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=config.HTTP_RETRIES,
+                connect=0,  # fetch_url_content already retries failed connections without a UA
+                read=False,  # ... and read timeouts - only the status retries below happen here
+                backoff_factor=config.HTTP_RETRY_BACKOFF,
+                status_forcelist=[502, 503, 504],
+                respect_retry_after_header=False,  # a server's Retry-After (could be hours) must not stall the scan
+                raise_on_status=False  # hand back the last response so raise_for_status() still reports it
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # LRU of fetched JS by URL - shared CDN files (jQuery, analytics...) are fetched once per run
+        self._fetch_cache = OrderedDict()
+        self._fetch_cache_bytes = 0  # total length of the cached bodies
+        self._fetch_cache_lock = threading.Lock()  # JS files are fetched from several threads
+
         # init logger instance
         self.logger = get_logger()
 
-        
-    def fetch_url_content(self, url, timeout=config.REQUEST_TIMEOUT, user_agent = random.choice(config.USER_AGENTS)):
-        self.logger.debug(f"Fetching URL: {url} with user-agent: {user_agent}")
-
-        try:
-            # Try with random user agent first
-            headers = {'User-Agent': user_agent}
-            self.logger.verbose(f"making request to {url} with headers: {headers}")
-
-            response = self.session.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-
-            content_length = len(response.content)
-            self.logger.log_request_details(url, response.status_code, content_length)
-            self.logger.debug(f"Response headers: {dict(response.headers)}")
-
-            return response.text
-
-        except requests.exceptions.HTTPError as e:
-            self.logger.debug(f"HTTP Error for {url}: {e}")
-
-            # Sometimes user-agent gets blocked. If we get 403/blocked, try without user agent
-            if e.response and e.response.status_code in [403, 429]:
-                jsauce_banner.add_status(f"User agent blocked for {url}, trying without UA...", "warning")
-                self.logger.warning(f"User agent blocked for {url}, trying without UA...")
-
-                try:
-                    self.logger.verbose(f"making request to {url} without user-agent")
-
-                    # Try again without any user agent (requests default)
-                    response = self.session.get(url, timeout=timeout)
-                    response.raise_for_status()
-
-                    content_length = len(response.content)
-                    self.logger.log_request_details(url, response.status_code, content_length)
-                    jsauce_banner.add_status(f"Success without user agent: {url}", "success")
-
-                    return response.text
-                
-                # If ssl error occurs, try HTTP instead
-                except requests.exceptions.SSLError as e:
-                    self.logger.debug(f"SSL Error for {url}: {e}")
+        # Checked before building per-request log messages
+        self._debug_on = self.logger.is_debug_enabled()
+        self._verbose_on = self.logger.is_verbose_enabled()
 
+        
+    def fetch_url_content(self, url, timeout=config.REQUEST_TIMEOUT, user_agent=_RANDOM_UA, cacheable=True,
+                          max_bytes=config.MAX_JS_BYTES):
+        if cacheable:
+            with self._fetch_cache_lock:
+                cached = self._fetch_cache.get(url)
+                if cached is not None:
+                    self._fetch_cache.move_to_end(url)
+            if cached is not None:
+                if self._debug_on:
+                    self.logger.debug(f"Using cached content for {url}")
+                return cached
+
+        # Pick per call - a default argument would be evaluated once and reused for the whole run
+        if user_agent is _RANDOM_UA:
+            ua_headers = random.choice(_UA_HEADERS)
+            user_agent = ua_headers['User-Agent']
+        else:
+            ua_headers = {'User-Agent': user_agent} if user_agent is not None else None
+        if self._debug_on:
+            self.logger.debug(f"Fetching URL: {url} with user-agent: {user_agent}")
+
+        # Walk the fallbacks until one succeeds - each only runs if it fits the previous failure
+        target = url
+        last_error = None
+        for attempt in _ATTEMPTS:
+            if last_error is not None:
+                if attempt['force_http']:
                     # SSL error - try HTTP instead
-                    if url.startswith('https://'):
-                        jsauce_banner.add_status(f"SSL error with {url}, trying HTTP...", "warning")
-                        self.logger.warning(f"SSL error with {url}, trying HTTP...")
-                        http_url = url.replace('https://', 'http://', 1)
-                        return self.fetch_url_content(http_url, timeout)
-                    else:
-                        jsauce_banner.add_status(f"SSL error: {e}", "error")
-                        self.logger.error(f"SSL error: {e}")
-                        return None
-                        
-                # If any other error occurs, log it
-                except requests.RequestException as e2:
-                    error_details = f"Error fetching {url} (both with and without UA): {type(e2).__name__}: {str(e2)}"
-                    jsauce_banner.add_status(error_details, "error")
-                    self.logger.error(error_details)
-                    return None
-            else:
-                error_details = f"Error fetching {url}: {type(e).__name__}: {str(e)}"
-                jsauce_banner.add_status(error_details, "error")
-                self.logger.error(error_details)
-                return None
-        except requests.RequestException as e:
-            self.logger.debug(f"Request Error for {url}: {e}")
-            # For other errors, try without user agent as fallback
-            jsauce_banner.add_status(f"Request failed for {url}, trying without UA...", "warning")
-            self.logger.warning(f"Request failed for {url}, trying without UA...")
+                    if not (isinstance(last_error, requests.exceptions.SSLError) and url.startswith('https://')):
+                        break
+                    target = 'http://' + url[8:]  # len('https://') == 8
+                    jsauce_banner.add_status(f"SSL error with {url}, trying HTTP...", "warning")
+                    self.logger.warning(f"SSL error with {url}, trying HTTP...")
+                elif user_agent is None:
+                    # first attempt already went out without one
+                    continue
+                elif isinstance(last_error, requests.exceptions.HTTPError) and \
+                        last_error.response.status_code not in _RETRY_STATUSES:
+                    break
+                else:
+                    # Sometimes user-agent gets blocked (403/429) - try the requests default instead
+                    jsauce_banner.add_status(f"Request failed for {url}, trying without UA...", "warning")
+                    self.logger.warning(f"Request failed for {url}, trying without UA...")
+
+            headers = ua_headers if attempt['use_ua'] else None
+            if self._verbose_on:
+                self.logger.verbose(f"making request to {target} with headers: {headers}")
 
             try:
-                self.logger.verbose(f"making request to {url} without user-agent")
-                response = self.session.get(url, timeout=timeout)
+                fetched = self._get(target, timeout, max_bytes, headers=headers)
+                if fetched is None:
+                    return None
+                response, body = fetched
                 response.raise_for_status()
+            except requests.RequestException as e:
+                self.logger.debug(f"Request Error for {target}: {e}")
+                last_error = e
+                continue
+
+            if self._verbose_on:
+                self.logger.log_request_details(target, response.status_code, len(body))
+            if self._debug_on:
+                self.logger.debug(f"Response headers: {dict(response.headers)}")
+            if attempt is not _ATTEMPTS[0]:
+                jsauce_banner.add_status(f"Success without user agent: {target}", "success")
+                self.logger.success(f"Success without user agent: {target}")
+
+            return self._remember(url, self._decode_body(response, body), cacheable)
+
+        error_details = f"Error fetching {url}: {type(last_error).__name__}: {str(last_error)}"
+        jsauce_banner.add_status(error_details, "error")
+        self.logger.error(error_details)
+        return None
+
+    # GET with a body size cap - returns (response, body bytes), or None (dropping the connection)
+    # when the body is bigger
+    def _get(self, url, timeout, max_bytes, headers=None):
+        if max_bytes is None:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            return response, response.content
+
+        response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        if response.status_code >= 400:
+            # raise_for_status() only needs the status - don't download the error page
+            response.close()
+            return response, b''
+
+        # Giant bundles cost memory and make the regex scan crawl - stop before downloading them
+        declared = response.headers.get('Content-Length', '')
+        oversize = declared.isdigit() and int(declared) > max_bytes
+        if not oversize:
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body += chunk
+                if len(body) > max_bytes:
+                    oversize = True
+                    break
+
+        if oversize:
+            response.close()
+            jsauce_banner.add_status(f"Skipping {url} - larger than {max_bytes} bytes", "warning")
+            self.logger.warning(f"Skipping {url} - larger than {max_bytes} bytes")
+            return None
+
+        return response, bytes(body)
+
+    # keep fetched content in the LRU cache and pass it through
+    def _remember(self, url, content, cacheable):
+        if cacheable and config.FETCH_CACHE_MAX > 0 and len(content) <= config.FETCH_CACHE_MAX_BYTES:
+            with self._fetch_cache_lock:
+                previous = self._fetch_cache.pop(url, None)
+                if previous is not None:
+                    self._fetch_cache_bytes -= len(previous)
+                self._fetch_cache[url] = content
+                self._fetch_cache_bytes += len(content)
+                # Evict the least recently used files until both the entry and size limits hold
+                while (len(self._fetch_cache) > config.FETCH_CACHE_MAX
+                       or self._fetch_cache_bytes > config.FETCH_CACHE_MAX_BYTES):
+                    _, evicted = self._fetch_cache.popitem(last=False)
+                    self._fetch_cache_bytes -= len(evicted)
+        return content
+
+    # decode a response body once, without response.text's charset sniffing
+    def _decode_body(self, response, body):
+        # response.text runs charset detection over the whole body whenever the server
+        # doesn't declare one (common for JS) - assume UTF-8 there instead
+        try:
+            return body.decode(response.encoding or 'utf-8', errors='replace')
+        except LookupError:
+            # unknown charset name in the headers
+            return body.decode('utf-8', errors='replace')
 
-                content_length = len(response.content)
-                self.logger.log_request_details(url, response.status_code, content_length)
-                jsauce_banner.add_status(f"Success without user agent: {url}", "success")
-                self.logger.success(f"Success without user agent: {url}")
-
-                return response.text
-            except requests.RequestException as e2:
-                error_details = f"Error fetching {url} (both with and without UA): {type(e2).__name__}: {str(e2)}"
-                jsauce_banner.add_status(error_details, "error")
-                self.logger.error(error_details)
-                return None
-        
     # add protocol if missing from url
     def add_protocol_if_missing(self, url):
-        if not url.startswith(('http://', 'https://')):
+        if not url.startswith(_PROTO_PREFIXES):
             modified_url = 'https://' + url
             self.logger.debug(f"added protocol to {url} - {modified_url}")
             return modified_url
@@ -117,11 +217,12 @@ class WebRequests:
 
     # save url content to file
     def save_url_content(self, url, content):
-        filename = os.path.basename(urlparse(url).path) or f"un-named.html"
-        file_path = f"{config.URL_CONTENT_DIR}/{filename}"
+        filename = _SAFE_NAME_RE.sub('_', os.path.basename(urlparse(url).path)) or f"un-named.html"
+        file_path = f"{config.URL_CONTENT_DIR}/{filename}.gz"
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
+            # level 1 - pages compress well even at the fastest setting
+            with gzip.open(file_path, 'wt', encoding='utf-8', compresslevel=1) as file:
                 file.write(content)
             self.logger.log_file_operation("Saved", file_path, True)
             self.logger.debug(f"Saved {len(content)} bytes to {file_path}")
@@ -135,8 +236,12 @@ class WebRequests:
             self.session.close()
             self.logger.debug("HTTP Session closed")
     
-    # session cleanup
-    def __del__(self):
+    # session cleanup - use as a context manager or call close_session(), a __del__ can run
+    # after requests/urllib3 are torn down at interpreter exit
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close_session()
 
 
@@ -1,18 +1,63 @@
 import os
+import sys
 import time
+import threading
 from collections import deque
 
+# Home the cursor, clear the screen and the scrollback - what `clear` sends, without a subprocess per redraw
+_CLEAR_SEQ = "\033[H\033[2J\033[3J"
+
+# Redraws go over the previous frame instead: cursor home, erase the rest of each line, then below the frame
+_HOME_SEQ = "\033[H"
+_EOL_SEQ = "\033[K\n"
+_EOS_SEQ = "\033[J"
+
+# Windows consoles only honour ANSI sequences once VT processing is on - an empty system() call enables it
+if os.name == 'nt':
+    os.system('')
+
+
+def _write_frame(frame):
+    """Send a full frame to stdout as one block write, bypassing the line-buffered text layer"""
+    out = sys.stdout
+    out.flush()  # anything already printed goes first
+    raw = getattr(out, 'buffer', None)
+    if raw is None:
+        # replaced stdout without a byte layer (e.g. StringIO)
+        out.write(frame)
+        out.flush()
+        return
+    raw.write(frame.encode(out.encoding or 'utf-8', out.errors or 'strict'))
+    raw.flush()
+
+# ANSI color codes
+_RED = "\033[31m"
+_GREEN = "\033[32m"
+_CYAN = "\033[36m"
+_YELLOW = "\033[33m"
+_RESET = "\033[0m"
+_BOLD = "\033[1m"
+
+# (color, prefix) per status message type
+_TYPE_STYLES = {
+    "success": (_GREEN, "✓"),
+    "warning": (_YELLOW, "⚠"),
+    "error": (_RED, "✗"),
+    "info": (_CYAN, "•")
+}
+_DEFAULT_STYLE = (_RESET, "•")
+
 # JSAUCE ASCII banner with color and persistent status
 class Banner:
+    # Color codes stay reachable as banner.RED etc.
+    RED = _RED
+    GREEN = _GREEN
+    CYAN = _CYAN
+    YELLOW = _YELLOW
+    RESET = _RESET
+    BOLD = _BOLD
+
     def __init__(self, max_status_lines=10):
-        # ANSI color codes
-        self.RED = "\033[31m"
-        self.GREEN = "\033[32m"
-        self.CYAN = "\033[36m"
-        self.YELLOW = "\033[33m"
-        self.RESET = "\033[0m"
-        self.BOLD = "\033[1m"
-        
         # Store banner content for reuse
         self.banner = r"""
         ██╗███████╗ █████╗ ██╗   ██╗ ██████╗███████╗
@@ -25,20 +70,42 @@ class Banner:
       """
         self.tagline = "                By Papv2 (ethicalPap)"
         
+        # Fixed parts of every frame, colored once here instead of on each redraw
+        self._banner_colored = f"{_RED}{self.banner}{_RESET}\n{_CYAN}{self.tagline}{_RESET}"
+        self._sep80 = "=" * 80
+        self._sub80 = "-" * 80
+        self._status_header = f"{_BOLD}Status Log:{_RESET}"
+        self._waiting_line = f"{_CYAN}• Waiting for status updates...{_RESET}"
+        
+        # Progress bar pieces, sliced to length instead of rebuilt per update
+        self._bar_full = "█" * 30
+        self._bar_empty = "░" * 30
+        
         # Persistent status log
         self.max_status_lines = max_status_lines
         self.status_log = deque(maxlen=max_status_lines)
         self.current_progress = None
         self.is_initialized = False
         
+        # Status updates may come from worker threads (e.g. parallel JSON cleanup)
+        self._lock = threading.RLock()
+        
+        # Redraw throttling - bursts of status updates repaint at most every interval
+        self._min_refresh_interval = 0.05
+        self._last_refresh = 0.0
+        self._dirty = False
+        self._redraw_timer = None  # pending deferred redraw for held back updates
+        
+        # (second, "%H:%M:%S") of the last status message
+        self._ts_cache = (0, "")
+        
     def print_jsauce_banner(self):
         """Print the banner once (original method)"""
-        print(self.RED + self.banner + self.RESET)
-        print(self.CYAN + self.tagline + self.RESET)
+        print(self._banner_colored)
     
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        print(_CLEAR_SEQ, end='')
     
     def print_frozen_banner(self, status_message="", progress=None):
         """
@@ -48,9 +115,8 @@ class Banner:
         self.clear_screen()
         
         # Print banner at top
-        print(self.RED + self.banner + self.RESET)
-        print(self.CYAN + self.tagline + self.RESET)
-        print("=" * 80)
+        print(self._banner_colored)
+        print(self._sep80)
         
         # Print status information below banner
         if progress:
@@ -58,109 +124,127 @@ class Banner:
         if status_message:
             print(f"Status: {status_message}")
         if progress or status_message:
-            print("-" * 80)
+            print(self._sub80)
     
     def initialize_persistent_display(self):
         """Initialize the persistent display with banner"""
-        self.clear_screen()
-        print(self.RED + self.banner + self.RESET)
-        print(self.CYAN + self.tagline + self.RESET)
-        print("=" * 80)
-        self.is_initialized = True
-        self._refresh_display()
+        with self._lock:
+            self.clear_screen()
+            print(self._banner_colored)
+            print(self._sep80)
+            self.is_initialized = True
+            self._refresh_display()
     
     def add_status(self, message, message_type="info"):
         """
         Add a status message to the persistent log
         message_type: 'info', 'success', 'warning', 'error'
         """
-        timestamp = time.strftime("%H:%M:%S")
+        # Reuse the formatted time while still in the same second
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        timestamp = self._ts_cache[1]
         
         # Color coding based on message type
-        color = self.RESET
-        prefix = "•"
-        
-        if message_type == "success":
-            color = self.GREEN
-            prefix = "✓"
-        elif message_type == "warning":
-            color = self.YELLOW
-            prefix = "⚠"
-        elif message_type == "error":
-            color = self.RED
-            prefix = "✗"
-        elif message_type == "info":
-            color = self.CYAN
-            prefix = "•"
+        color, prefix = _TYPE_STYLES.get(message_type, _DEFAULT_STYLE)
         
         # Truncate very long error messages to prevent display corruption
-        if len(message) > 120:
-            message = message[:117] + "..."
-        
-        formatted_message = f"{color}[{timestamp}] {prefix} {message}{self.RESET}"
-        self.status_log.append(formatted_message)
-        
-        if self.is_initialized:
-            self._refresh_display()
+        if len(message) <= 120:
+            formatted_message = f"{color}[{timestamp}] {prefix} {message}{_RESET}"
+        else:
+            formatted_message = f"{color}[{timestamp}] {prefix} {message[:117]}...{_RESET}"
+        with self._lock:
+            self.status_log.append(formatted_message)
+            
+            if self.is_initialized:
+                self._maybe_refresh()
     
     def update_progress(self, current, total, description=""):
         """Update progress information"""
         if total > 0:
             percentage = (current / total) * 100
             progress_bar = self._create_progress_bar(percentage)
-            self.current_progress = f"{description} [{current}/{total}] {progress_bar} {percentage:.1f}%"
+            progress = f"{description} [{current}/{total}] {progress_bar} {percentage:.1f}%"
         else:
-            self.current_progress = f"{description} [{current}]"
+            progress = f"{description} [{current}]"
         
-        if self.is_initialized:
-            self._refresh_display()
+        with self._lock:
+            self.current_progress = progress
+            if self.is_initialized:
+                self._maybe_refresh()
     
     def _create_progress_bar(self, percentage, width=30):
         """Create a visual progress bar"""
-        filled = int(width * percentage / 100)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"|{bar}|"
+        # Clamp so counts past the total (or below zero) still give a bar of the right width
+        filled = max(0, min(width, int(width * percentage / 100)))
+        if width <= len(self._bar_full):
+            return f"|{self._bar_full[:filled]}{self._bar_empty[:width - filled]}|"
+        return f"|{'█' * filled}{'░' * (width - filled)}|"
+    
+    def _maybe_refresh(self):
+        """Redraw now, or once the interval is up if the last redraw was too recent - callers hold the lock"""
+        wait = self._min_refresh_interval - (time.monotonic() - self._last_refresh)
+        if wait <= 0:
+            self._refresh_display()
+            return
+        
+        # Held back - make sure it still gets drawn even if nothing else is posted (e.g. before a long fetch)
+        self._dirty = True
+        if self._redraw_timer is None:
+            self._redraw_timer = threading.Timer(wait, self.flush)
+            self._redraw_timer.daemon = True
+            self._redraw_timer.start()
+    
+    def flush(self):
+        """Draw any status updates that were held back by throttling"""
+        with self._lock:
+            if self._redraw_timer is not None:
+                self._redraw_timer.cancel()
+                self._redraw_timer = None
+            if self._dirty and self.is_initialized:
+                self._refresh_display()
     
     def _refresh_display(self):
         """Refresh the entire display by completely redrawing"""
-        # Instead of cursor positioning, just clear and redraw everything
-        self.clear_screen()
-        
-        # Print banner at top
-        print(self.RED + self.banner + self.RESET)
-        print(self.CYAN + self.tagline + self.RESET)
-        print("=" * 80)
+        with self._lock:
+            self._draw_display()
+            self._last_refresh = time.monotonic()
+            self._dirty = False
+    
+    def _draw_display(self):
+        """Draw the full display - callers must hold the display lock"""
+        # Build the whole frame first so it goes out in one write - no half drawn screens
+        # Banner at top
+        lines = [self._banner_colored, self._sep80]
         
-        # Print current progress if available
+        # Current progress if available
         if self.current_progress:
-            print(f"{self.BOLD}Progress:{self.RESET} {self.current_progress}")
-            print("-" * 80)
+            lines.append(f"{_BOLD}Progress:{_RESET} {self.current_progress}")
+            lines.append(self._sub80)
         
-        # Print status log header
-        print(f"{self.BOLD}Status Log:{self.RESET}")
+        # Status log header
+        lines.append(self._status_header)
         
-        # Print status messages
-        if self.status_log:
-            for status in self.status_log:
-                print(status)
-        else:
-            print(f"{self.CYAN}• Waiting for status updates...{self.RESET}")
+        # Status messages - already formatted, joined as one block
+        lines.append("\n".join(self.status_log) if self.status_log else self._waiting_line)
         
-        # Print separator
-        print("-" * 80)
+        # Separator
+        lines.append(self._sub80)
         
-        # Flush output to ensure immediate display
-        import sys
-        sys.stdout.flush()
+        # Overwrite the previous frame in place - clearing first makes the terminal blank and repaint
+        # everything (flicker). The banner is still sent each time since -v log output can scroll it away
+        _write_frame(_HOME_SEQ + "\n".join(lines).replace("\n", _EOL_SEQ) + _EOL_SEQ + _EOS_SEQ)
     
     def update_status(self, message, progress=None, delay=0, message_type="info"):
         """
         Enhanced update_status that uses persistent display
         """
-        if not self.is_initialized:
-            self.initialize_persistent_display()
+        with self._lock:
+            if not self.is_initialized:
+                self.initialize_persistent_display()
         
-        self.add_status(message, message_type)
+            self.add_status(message, message_type)
         
         if delay > 0:
             time.sleep(delay)
@@ -169,61 +253,68 @@ class Banner:
         """
         Show completion message with banner and preserve status log
         """
-        if not self.is_initialized:
-            self.initialize_persistent_display()
+        # One block under the lock so lines from other threads don't land in the middle
+        with self._lock:
+            if not self.is_initialized:
+                self.initialize_persistent_display()
         
-        # Set final progress state
-        self.current_progress = f"{self.GREEN}✓ COMPLETED - Processed {total_processed} items{self.RESET}"
+            # Set final progress state
+            self.current_progress = f"{_GREEN}✓ COMPLETED - Processed {total_processed} items{_RESET}"
         
-        # Add completion status to log
-        self.add_status("=" * 50, "info")
-        self.add_status(f"PROCESSING COMPLETED!", "success")
-        self.add_status(f"Processed {total_processed} items total", "success")
+            # Add completion status to log
+            self.add_status("=" * 50, "info")
+            self.add_status(f"PROCESSING COMPLETED!", "success")
+            self.add_status(f"Processed {total_processed} items total", "success")
         
-        if details:
-            for detail in details:
-                if "⚠️" in detail or "warning" in detail.lower():
-                    self.add_status(detail, "warning")
-                elif "✓" in detail or "success" in detail.lower():
-                    self.add_status(detail, "success")
-                else:
-                    self.add_status(detail, "info")
+            if details:
+                for detail in details:
+                    if "⚠️" in detail or "warning" in detail.lower():
+                        self.add_status(detail, "warning")
+                    elif "✓" in detail or "success" in detail.lower():
+                        self.add_status(detail, "success")
+                    else:
+                        self.add_status(detail, "info")
         
-        self.add_status("=" * 50, "info")
+            self.add_status("=" * 50, "info")
         
-        # Refresh display with final progress
-        self._refresh_display()
+            # Refresh display with final progress
+            self._refresh_display()
     
     def show_error(self, error_message):
         """Show error message in the persistent display"""
-        if not self.is_initialized:
-            self.initialize_persistent_display()
+        # Check-and-initialize under the lock - these are called from worker threads too
+        with self._lock:
+            if not self.is_initialized:
+                self.initialize_persistent_display()
         
-        self.add_status(f"ERROR: {error_message}", "error")
+            self.add_status(f"ERROR: {error_message}", "error")
     
     def show_warning(self, warning_message):
         """Show warning message in the persistent display"""
-        if not self.is_initialized:
-            self.initialize_persistent_display()
+        with self._lock:
+            if not self.is_initialized:
+                self.initialize_persistent_display()
         
-        self.add_status(f"WARNING: {warning_message}", "warning")
+            self.add_status(f"WARNING: {warning_message}", "warning")
     
     def show_success(self, success_message):
         """Show success message in the persistent display"""
-        if not self.is_initialized:
-            self.initialize_persistent_display()
+        with self._lock:
+            if not self.is_initialized:
+                self.initialize_persistent_display()
         
-        self.add_status(success_message, "success")
+            self.add_status(success_message, "success")
     
     def clear_status_log(self):
         """Clear the status log"""
-        self.status_log.clear()
-        if self.is_initialized:
-            self._refresh_display()
+        with self._lock:
+            self.status_log.clear()
+            if self.is_initialized:
+                self._refresh_display()
     
     def set_max_status_lines(self, max_lines):
         """Change the maximum number of status lines to display"""
-        self.max_status_lines = max_lines
-        # Create new deque with new size, preserving existing messages
-        old_log = list(self.status_log)
-        self.status_log = deque(old_log[-max_lines:], maxlen=max_lines)
\ No newline at end of file
+        with self._lock:
+            self.max_status_lines = max_lines
+            # maxlen is read-only - re-wrapping keeps the newest messages that fit
+            self.status_log = deque(self.status_log, maxlen=max_lines)
\ No newline at end of file
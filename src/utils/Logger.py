@@ -1,9 +1,18 @@
 # verbose logging -v -vv -vvv
 from enum import IntEnum
 import logging
+import logging.handlers
+import atexit
+import queue
 import sys
 import os
 
+# None of the formats below use thread/process names or the caller's file/line - don't collect them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None  # skips the stack walk findCaller() does for every record
+
 class VerbosityLevel(IntEnum):
     SILENT = 0
     NORMAL = 1
@@ -13,7 +22,9 @@ class VerbosityLevel(IntEnum):
 class LoggingConfig:
     def __init__(self, verbosity_level=0, banner=None, log_file=None):
         self.verbosity_level = verbosity_level
-        self.banner = banner
+        self._debug_enabled = verbosity_level >= VerbosityLevel.DEBUG  # checked on every debug/verbose call
+        self._verbose_enabled = verbosity_level >= VerbosityLevel.VERBOSE
+        self.banner = banner  # messages are only mirrored there once its display is initialized
 
         # setup logging
         self.logger = logging.getLogger('jsauce')
@@ -25,7 +36,7 @@ class LoggingConfig:
         # add console handler if -v > 0
         if verbosity_level > 0:
             handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s]', datefmt='%H:%M:%S')
+            formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s', datefmt='%H:%M:%S')
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
@@ -36,13 +47,26 @@ class LoggingConfig:
                 file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
                 file_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
                 file_handler.setFormatter(file_formatter)
-                self.logger.addHandler(file_handler)
+
+                # Write the file from a background thread, in batches - the scanning threads only enqueue records.
+                # Batches go out when full, on ERROR or at exit
+                log_queue = queue.Queue()
+                buffered_handler = logging.handlers.MemoryHandler(
+                    capacity=1024, flushLevel=logging.ERROR, target=file_handler
+                )
+                self._listener = logging.handlers.QueueListener(log_queue, buffered_handler)
+                self._listener.start()
+                atexit.register(self._listener.stop)  # runs before logging's own shutdown flush
+                self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
                 # Always log at least INFO level to file
                 if self.logger.level > logging.INFO:
                     self.logger.setLevel(logging.INFO)
             except Exception as e:
                 print(f"Warning: Could not create log file {log_file}: {e}")
+
+        # Nowhere for messages to go - info/success/warning/error return straight away
+        self._any_output = bool(self.logger.handlers) or banner is not None
             
     # Log levels mapped to verbosity
     def _get_log_level(self):
@@ -58,62 +82,102 @@ class LoggingConfig:
 
     """now we need to set functions for each verosity level"""
 
+    def is_debug_enabled(self):
+        """True when debug messages will be emitted, lets hot loops skip building them"""
+        return self._debug_enabled
+
+    def is_verbose_enabled(self):
+        """True when verbose messages will be emitted"""
+        return self._verbose_enabled
+
     def debug(self, message, *args, **kwargs):
-        if self.verbosity_level >= VerbosityLevel.DEBUG:
-            self.logger.debug(message, *args, **kwargs)
-            if self.banner:
-                self.banner.add_status(f"[DEBUG] {message}", "info")
+        if not self._debug_enabled:
+            return
+        self.logger.debug(message, *args, **kwargs)
+        if self.banner and self.banner.is_initialized:
+            self.banner.add_status(f"[DEBUG] {message}", "info")
 
     def verbose(self, message, *args, **kwargs):
-        if self.verbosity_level >= VerbosityLevel.VERBOSE:
-            self.logger.info(message, *args, **kwargs)
-            if self.banner:
-                self.banner.add_status(f"[VERBOSE] {message}", "info")
+        if not self._verbose_enabled:
+            return
+        self.logger.info(message, *args, **kwargs)
+        if self.banner and self.banner.is_initialized:
+            self.banner.add_status(f"[VERBOSE] {message}", "info")
 
     def info(self, message, *args, **kwargs):
+        if not self._any_output:
+            return
         self.logger.info(message, *args, **kwargs)
-        if self.banner:
+        if self.banner and self.banner.is_initialized:
             self.banner.add_status(f"[INFO] {message}", "info")
 
     def success(self, message, *args, **kwargs):
+        if not self._any_output:
+            return
         self.logger.info(message, *args, **kwargs)
-        if self.banner:
+        if self.banner and self.banner.is_initialized:
             self.banner.add_status(f"[SUCCESS] {message}", "success")
 
     def warning(self, message, *args, **kwargs):
+        if not self._any_output:
+            return
         self.logger.warning(message, *args, **kwargs)
-        if self.banner:
+        if self.banner and self.banner.is_initialized:
             self.banner.add_status(f"[WARNING] {message}", "warning")
 
     def error(self, message, *args, **kwargs):
+        if not self._any_output:
+            return
         self.logger.error(message, *args, **kwargs)
-        if self.banner:
+        if self.banner and self.banner.is_initialized:
             self.banner.add_status(f"[ERROR] {message}", "error")
 
 
     """Create log levels for each package that is used as well"""
 
+    def _verbose_lazy(self, message, *args):
+        """verbose() for %-style messages - only formatted by a handler that takes the record, or for the banner"""
+        self.logger.info(message, *args)
+        if self.banner and self.banner.is_initialized:
+            self.banner.add_status(f"[VERBOSE] {message % args}", "info")
+
     def log_request_details(self, url, status_code, content_length):
-        self.verbose(f"HTTP Request Details - URL: {url}, Status Code: {status_code}, Content Length: {content_length}")
+        if not self._verbose_enabled:
+            return
+        self._verbose_lazy("HTTP Request Details - URL: %s, Status Code: %s, Content Length: %s", url, status_code, content_length)
 
     def log_js_analysis(self, js_url, patterns_found, total_patterns):
-        self.verbose(f"JS Analysis - URL: {js_url}, Patterns Found: {patterns_found}, Total Patterns: {total_patterns}")
+        if not self._verbose_enabled:
+            return
+        self._verbose_lazy("JS Analysis - URL: %s, Patterns Found: %s, Total Patterns: %s", js_url, patterns_found, total_patterns)
 
     def log_pattern_match(self, pattern, matches, category):
-        self.verbose(f"Pattern Match - Pattern: {pattern}, Matches: {matches}, Category: {category}")
+        if not self._verbose_enabled:
+            return
+        self._verbose_lazy("Pattern Match - Pattern: %s, Matches: %s, Category: %s", pattern, matches, category)
 
     def log_template_loading(self, template_file, categories_count):
-        self.verbose(f"Template Loading - File: {template_file}, Categories Count: {categories_count}")
+        if not self._verbose_enabled:
+            return
+        self._verbose_lazy("Template Loading - File: %s, Categories Count: %s", template_file, categories_count)
 
     def log_file_operation(self, operation, file_path, success=True):
-        self.verbose(f"{operation} File - Path: {file_path}, Success: {success}")
+        if not self._verbose_enabled:
+            return
+        self._verbose_lazy("%s File - Path: %s, Success: %s", operation, file_path, success)
 
-    def log_processing_stats(self, domain, total_content_found, has_any_findings, je_files_with_findings, js_files_processed):
-        self.info(f"Processing Stats - Domain: {domain}, Endpoints Found: {total_content_found}, Has Findings: {has_any_findings}, JS Files with Findings: {je_files_with_findings}/{js_files_processed}")
+    def log_processing_stats(self, domain, total_content_found, has_any_findings, js_files_with_findings, js_files_processed):
+        self.info(f"Processing Stats - Domain: {domain}, Endpoints Found: {total_content_found}, Has Findings: {has_any_findings}, JS Files with Findings: {js_files_with_findings}/{js_files_processed}")
 
 
 class NullLogger:
     """A null logger that does nothing - used as fallback when -v is not set"""
+    def is_debug_enabled(self):
+        return False
+
+    def is_verbose_enabled(self):
+        return False
+
     def debug(self, message, *args, **kwargs):
         pass
     
@@ -153,11 +217,14 @@ class NullLogger:
 # Global logger instance ---> might move to main later, we'll see
 _logger_instance = None
 
+# NullLogger keeps no state, so one shared instance serves every caller
+_NULL_LOGGER = NullLogger()
+
 # get global logger instance
 def get_logger():
     global _logger_instance
     if _logger_instance is None:
-        return NullLogger()
+        return _NULL_LOGGER
     return _logger_instance
 
 def initialize_logger(verbosity_level, banner=None, log_file=None):
@@ -0,0 +1,67 @@
+import http.server
+import threading
+import time
+
+import pytest
+
+from src import config
+from src.packages.WebRequests import WebRequests
+
+
+class _RetryAfterHandler(http.server.BaseHTTPRequestHandler):
+    """Always answers 503 with a huge Retry-After"""
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(503)
+        self.send_header('Retry-After', '3600')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _RetryAfterHandler.hits = 0
+    server = http.server.HTTPServer(('127.0.0.1', 0), _RetryAfterHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_retry_after_header_is_ignored(stub_server):
+    web_requests = WebRequests()
+    try:
+        start = time.monotonic()
+        content = web_requests.fetch_url_content(f"{stub_server}/app.js", timeout=1)
+        elapsed = time.monotonic() - start
+    finally:
+        web_requests.close_session()
+
+    assert content is None
+    # only the configured backoff applies - honouring Retry-After would sleep for an hour
+    assert elapsed < 10
+    # the first request plus the adapter's status retries, 503 isn't retried without the user agent
+    assert _RetryAfterHandler.hits == 1 + config.HTTP_RETRIES
+
+
+def test_fetch_cache_is_bounded_by_size(monkeypatch):
+    monkeypatch.setattr(config, "FETCH_CACHE_MAX", 10)
+    monkeypatch.setattr(config, "FETCH_CACHE_MAX_BYTES", 100)
+    web = WebRequests()
+
+    for i in range(5):
+        web._remember(f"https://cdn.example/{i}.js", "x" * 40, True)
+    # least recently used files are dropped once the size budget is exceeded
+    assert list(web._fetch_cache) == ["https://cdn.example/3.js", "https://cdn.example/4.js"]
+    assert web._fetch_cache_bytes == 80
+
+    # a file bigger than the whole budget is passed through but not cached
+    assert web._remember("https://cdn.example/big.js", "x" * 101, True) == "x" * 101
+    assert "https://cdn.example/big.js" not in web._fetch_cache
+    assert web._fetch_cache_bytes == 80